@@ -16,12 +16,92 @@ import re
 import socket
 import threading
 import time
+from collections import deque
+from itertools import chain
 from datetime import datetime
 
 import streamlit as st
 
+# Older Streamlit releases only provide experimental_rerun
+rerun = getattr(st, "rerun", None) or st.experimental_rerun
+
 ENCODING = "utf-8"
 DEFAULT_PORT = 8888
+LOG_MAX_LINES = 200  # Only the most recent log lines are kept
+RECV_SIZE = 65536  # Large enough to drain a whole burst of lines in one read
+FINAL_VISIBLE_ROWS = 20  # Final standings shown below the podium before folding
+
+# How often the event poller fragment checks for server events
+EVENT_POLL_INTERVAL = 0.2
+# Without st.fragment: longest time the script waits for server events
+# before rerunning anyway. Kept short while answer buttons are on screen
+# so clicks are picked up fast.
+ANSWER_RERUN_INTERVAL = 0.2
+IDLE_RERUN_INTERVAL = 1.0
+
+# Patterns used on every question / rerun, kept as named constants. The
+# script re-runs on every rerun, so re.compile() here is served from re's
+# internal cache rather than compiling once per process.
+OPTIONS_START_RE = re.compile(r"\bA\)")  # Where inline options begin
+# Option labels like 'A)'; the option text is whatever lies between labels
+OPTION_LABEL_RE = re.compile(r"([A-D])\)")
+WINNER_RE = re.compile(r"Winner=(\w+)")
+# One "name:pts" entry of a score payload; the name ends at the first ':'
+SCORE_RE = re.compile(r"(?:^|(?<=\|))([^|:]*):([^|]*)")
+
+# Resets the page to the default gradient on the pages that don't tint it
+DEFAULT_BACKGROUND_STYLE = """
+    <style>
+        .stApp {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+    </style>
+"""
+
+# "Get Ready!" card template shared by the between-questions pages; each page
+# fills it in only when it is the one being shown
+GET_READY_CARD = """
+    <div style='text-align: center; padding: 80px 40px; background: rgba(255,255,255,0.15); 
+         backdrop-filter: blur(20px); color: white; border-radius: 30px; 
+         box-shadow: 0 20px 60px rgba(0,0,0,0.3); max-width: 700px; margin: {margin}px auto;
+         animation: scaleIn 0.6s ease-out;'>
+        <div class='loader' style='margin: 0 auto 30px;'></div>
+        <h1 style='font-family: "Montserrat", sans-serif; font-weight: 900; font-size: {title_size}px; 
+             margin-bottom: 20px; text-shadow: 0 4px 8px rgba(0,0,0,0.3);'>Get Ready!</h1>
+        <p style='font-size: {message_size}px; opacity: 0.9; font-weight: {message_weight};'>{message}</p>
+    </div>
+"""
+
+# Timer (color, bar background) for the last, middle and first third of a question
+TIMER_STYLES = (
+    ("#ef4444", "linear-gradient(135deg, #ef4444, #dc2626)"),
+    ("#f59e0b", "linear-gradient(135deg, #f59e0b, #d97706)"),
+    ("#10b981", "linear-gradient(135deg, #10b981, #059669)"),
+)
+
+# Leaderboard row (medal, CSS class) by rank; the classes live in the page CSS
+RANK_STYLES = {
+    1: ("🥇", "lb-gold"),
+    2: ("🥈", "lb-silver"),
+    3: ("🥉", "lb-bronze"),
+}
+DEFAULT_RANK_STYLE = ("", "lb-default")
+# CSS class of the current player's own row
+MY_RANK_CLASS = "lb-me"
+# Final-results podium (heading, name color) by rank
+PODIUM_STYLES = {
+    1: ("🥇 1st", "#D89E00"),
+    2: ("🥈 2nd", "#C0C0C0"),
+    3: ("🥉 3rd", "#CD7F32"),
+}
+
+# Results page (icon, background) by feedback kind
+FEEDBACK_STYLES = {
+    "correct": ("🎉", "linear-gradient(135deg, #10b981 0%, #059669 100%)"),
+    "wrong": ("💔", "linear-gradient(135deg, #ef4444 0%, #dc2626 100%)"),
+    "timeout": ("⏰", "linear-gradient(135deg, #f59e0b 0%, #d97706 100%)"),
+}
+DEFAULT_FEEDBACK_STYLE = ("", "linear-gradient(135deg, #667eea 0%, #764ba2 100%)")
 
 # 🎨 Kahoot-inspired color palette
 KAHOOT_COLORS = {
@@ -46,41 +126,114 @@ def parse_question_text_and_options(stem: str):
         return stem, {}, []
 
     # Identify where options start (first 'A)') to separate question text
-    m = re.search(r"\bA\)", stem)
+    m = OPTIONS_START_RE.search(stem)
     question_text = stem[: m.start()].strip() if m else stem.strip()
 
-    # Capture options like 'A) text  B) text  C) text  D) text'
-    # Non-greedy match until next label or end
-    pattern = r"([A-D])\)\s*(.*?)(?=\s*[A-D]\)\s*|$)"
+    # Capture options like 'A) text  B) text  C) text  D) text'. split()
+    # returns [before, label, text, label, text, ...], so the labels only
+    # anchor the slices and no lazy match has to probe ahead at every char.
     options_map = {}
     labels_order = []
-    for label, text in re.findall(pattern, stem, flags=re.S):
-        clean_text = " ".join(text.strip().split())  # collapse whitespace
+    parts = OPTION_LABEL_RE.split(stem)
+    for label, text in zip(parts[1::2], parts[2::2]):
+        clean_text = " ".join(text.split())  # collapse whitespace
         if clean_text:
             options_map[label] = clean_text
             labels_order.append(label)
 
     return question_text, options_map, labels_order
 
+
+def prepare_question(question: dict) -> None:
+    """Work out a new question's display text and answer buttons once.
+
+    Stores "text" (the stem without inline options) and "buttons" (a list of
+    (label, option_text) pairs) on the question dict, so the question page
+    does not re-parse the stem on every rerun.
+    """
+    cleaned_stem, options_map, labels_in_stem = parse_question_text_and_options(question["stem"])
+    opts = question["options"]
+
+    # Determine options
+    if opts is not None and isinstance(opts, (list, tuple)) and len(opts) > 0:
+        all_labels = ["A", "B", "C", "D"]
+        labels = all_labels[: len(opts)]
+        # Build map from provided opts if server sent them separately
+        options_map = {label: str(opts[i]) for i, label in enumerate(labels)}
+    else:
+        # Prefer labels detected in the stem via the parser
+        labels = labels_in_stem if labels_in_stem else ["A", "B", "C", "D"]
+
+    # Build from parsed/provided options if available; otherwise show generic labels
+    buttons = [(label, options_map[label]) for label in labels if label in options_map]
+    if not buttons:
+        buttons = [(label, f"Option {label}") for label in labels]
+
+    question["text"] = cleaned_stem
+    question["buttons"] = buttons
+
+
 def send_line(sock: socket.socket, text: str) -> None:
     """Send one logical line to the server."""
+    send_data(sock, text.encode(ENCODING) + b"\n")
+
+
+def send_data(sock: socket.socket, data: bytes) -> None:
+    """Send already-encoded, newline-terminated bytes to the server."""
     try:
-        sock.sendall((text + "\n").encode(ENCODING))
+        sock.sendall(data)
     except OSError:
         pass
 
 
+def close_socket(sock: socket.socket) -> None:
+    """Shut down and close the connection to the server.
+
+    shutdown() makes the recv_into() that listener_thread is blocked in return
+    right away (close() alone does not), so the thread exits on disconnect
+    instead of lingering with its file descriptor.
+    """
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    try:
+        sock.close()
+    except OSError:
+        pass
+
+
+# [second, "HH:MM:SS"] of the last log line, so a burst of lines within
+# the same second formats the timestamp only once
+log_timestamp_cache = [0, ""]
+
+
 def append_log(msg: str) -> None:
     """Append a timestamped log message to the session-level log buffer."""
     if "log" not in st.session_state:
-        st.session_state.log = []
+        st.session_state.log = deque(maxlen=LOG_MAX_LINES)
 
-    timestamp = time.strftime("%H:%M:%S")
-    st.session_state.log.append(f"{timestamp}  {msg}")
+    now = int(time.time())
+    if log_timestamp_cache[0] != now:
+        log_timestamp_cache[0] = now
+        log_timestamp_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
 
-    # Keep only the most recent 200 lines
-    if len(st.session_state.log) > 200:
-        st.session_state.log = st.session_state.log[-200:]
+    # The bounded deque drops the oldest line itself once full
+    st.session_state.log.append(f"{log_timestamp_cache[1]}  {msg}")
+
+
+def submit_answer(label: str) -> None:
+    """Answer-button callback: send the chosen label to the server.
+
+    Streamlit runs on_click callbacks before the rerun that a click
+    triggers, so the answer goes out at once and that rerun already shows
+    it locked in, without a second st.rerun().
+    """
+    ss = st.session_state
+    if ss.sock and ss.last_answer is None:
+        send_line(ss.sock, f"answer:{label}")
+        ss.last_answer = label
+        append_log(f"[ANSWER SENT '{label}']")
 
 
 def update_scoreboard_from_payload(payload: str) -> None:
@@ -89,16 +242,12 @@ def update_scoreboard_from_payload(payload: str) -> None:
         st.session_state.scoreboard = []
         return
 
-    scoreboard_list = []
-    rank = 1
-
-    for chunk in payload.split("|"):
-        if ":" in chunk:
-            uname, pts = chunk.split(":", 1)
-            scoreboard_list.append((rank, uname, pts))
-            rank += 1
-
-    st.session_state.scoreboard = scoreboard_list
+    # A single C-level scan over "name:pts|name:pts|..." instead of
+    # splitting the payload and then each entry
+    st.session_state.scoreboard = [
+        (rank, uname, pts)
+        for rank, (uname, pts) in enumerate(SCORE_RE.findall(payload), 1)
+    ]
 
 
 # ---------- Listener Thread ----------
@@ -106,41 +255,71 @@ def update_scoreboard_from_payload(payload: str) -> None:
 def listener_thread(
     sock: socket.socket,
     my_username: str,
-    ev_queue: "queue.Queue[tuple]",
+    ev_queue: "queue.Queue[list]",
+    wakeup: threading.Event,
 ) -> None:
-    """Background thread that receives messages from the server."""
-    buffer = ""
+    """Background thread that receives messages from the server.
+
+    The events parsed from one read are queued together as a single list,
+    so a burst of lines costs one put(). After each read ``wakeup`` is set
+    so the Streamlit script reruns right away instead of on its next idle
+    tick.
+    """
+    buffer = bytearray()  # Received bytes not yet split into lines
+    # recv_into() reuses this instead of allocating a bytes object per read
+    recv_buf = bytearray(RECV_SIZE)
+    recv_view = memoryview(recv_buf)
+    events = []  # (kind, payload) pairs from the current read
 
     while True:
         try:
-            chunk = sock.recv(4096)
+            n = sock.recv_into(recv_buf)
         except OSError:
-            ev_queue.put(("log", "[DISCONNECTED from server]"))
+            events.append(("log", "[DISCONNECTED from server]"))
             break
 
-        if not chunk:
-            ev_queue.put(("log", "[SERVER CLOSED CONNECTION]"))
+        if not n:
+            events.append(("log", "[SERVER CLOSED CONNECTION]"))
             break
 
-        buffer += chunk.decode(ENCODING, errors="ignore")
-
-        while "\n" in buffer:
-            line, buffer = buffer.split("\n", 1)
-            line = line.strip()
+        buffer += recv_view[:n]
+
+        # Cut lines out with find() from a moving start index and drop the
+        # consumed prefix once per read, so a burst of lines stays linear.
+        # Only the line itself is decoded, which also keeps multi-byte
+        # characters split across reads intact.
+        start = 0
+        while True:
+            nl = buffer.find(b"\n", start)
+            if nl < 0:
+                break
+            line = str(buffer[start:nl], ENCODING, "ignore").strip()
+            start = nl + 1
             if not line:
-                continue            # ----- Questions -----
-            if line.startswith("question:"):
-                raw_parts = line.split(":")
-                if len(raw_parts) < 4:  # Now needs at least qid, timeout, and stem
+                continue
+
+            # One scan splits "<kind>:<payload>"; each branch below compares
+            # kind instead of re-scanning the line with startswith()/split()
+            kind, sep, payload = line.partition(":")
+            if not sep:
+                events.append(("log", f"[SERVER MSG] {line}"))
+                continue
+
+            # ----- Questions -----
+            if kind == "question":
+                # Format: question:<id>:<timeout>:<stem> (the stem may contain ':')
+                c1 = payload.find(":")
+                c2 = payload.find(":", c1 + 1) if c1 != -1 else -1
+                if c2 == -1:  # Needs at least qid, timeout, and stem
                     continue
 
-                qid = raw_parts[1]
+                qid = payload[:c1]
                 try:
-                    timeout = int(raw_parts[2])
-                except (ValueError, IndexError):
+                    timeout = int(payload[c1 + 1:c2])
+                except ValueError:
                     continue  # Skip if timeout is not a valid integer
 
-                stem = ":".join(raw_parts[3:])
+                stem = payload[c2 + 1:]
                 q_data = {
                     "id": qid,
                     "stem": stem,
@@ -148,94 +327,97 @@ def listener_thread(
                     "options": None,  # Options are parsed from the stem later
                 }
 
-                ev_queue.put(("question", q_data))
-                ev_queue.put(("page", "question"))  # Force show question page
-                ev_queue.put(("clear_feedback", None))  # Clear old feedback
-                ev_queue.put(("log", f"[QUESTION {qid}] {q_data['stem']}"))
-                continue            # ----- Page transitions -----
-            if line.startswith("show:"):
-                page_name = line.split(":", 1)[1]
+                events.append(("question", q_data))
+                events.append(("page", "question"))  # Force show question page
+                events.append(("clear_feedback", None))  # Clear old feedback
+                events.append(("log", f"[QUESTION {qid}] {q_data['stem']}"))
+
+            # ----- Page transitions -----
+            elif kind == "show":
                 # Ignore all show: commands - we control page flow based on question/score events
-                ev_queue.put(("log", f"[PAGE] Server requested {page_name} (ignored)"))
-                continue
-            
+                events.append(("log", f"[PAGE] Server requested {payload} (ignored)"))
+
             # ----- Timer updates -----
-            if line.startswith("timer:"):
-                remaining = line.split(":", 1)[1]
-                ev_queue.put(("timer", int(remaining)))
-                continue
+            elif kind == "timer":
+                events.append(("timer", int(payload)))
 
             # ----- Individual feedback (new format) -----
-            if line.startswith("feedback:"):
+            elif kind == "feedback":
                 # Format: feedback:{username}:correct:{points}:{time}
                 # or: feedback:{username}:wrong:0:0
                 # or: feedback:{username}:timeout:0:0
-                parts = line.split(":")
-                if len(parts) >= 5:
-                    username = parts[1]
-                    result = parts[2]  # correct/wrong/timeout
-                    points = parts[3]
-                    time_taken = parts[4]
-                    
+                parts = payload.split(":", 3)
+                if len(parts) >= 4:
+                    username = parts[0]
+                    result = parts[1]  # correct/wrong/timeout
+                    points = parts[2]
+                    time_taken = parts[3]
+
                     if username == my_username:
                         if result == "correct":
-                            ev_queue.put(("feedback", f"✅ CORRECT! +{points} pts ({time_taken}s)"))
-                            ev_queue.put(("correct", True))
-                            ev_queue.put(("points", int(points)))
+                            events.append(("feedback", ("correct", f"✅ CORRECT! +{points} pts ({time_taken}s)")))
+                            events.append(("correct", True))
+                            events.append(("points", int(points)))
                         elif result == "wrong":
-                            ev_queue.put(("feedback", "❌ Wrong answer"))
-                            ev_queue.put(("correct", False))
+                            events.append(("feedback", ("wrong", "❌ Wrong answer")))
+                            events.append(("correct", False))
                         elif result == "timeout":
-                            ev_queue.put(("feedback", "⏰ Time's up!"))
-                            ev_queue.put(("correct", False))
-                continue            # ----- Broadcast messages -----
-            if line.startswith("broadcast:"):
-                msg = line.split(":", 1)[1]
-                ev_queue.put(("log", f"[BROADCAST] {msg}"))
+                            events.append(("feedback", ("timeout", "⏰ Time's up!")))
+                            events.append(("correct", False))
+
+            # ----- Broadcast messages -----
+            elif kind == "broadcast":
+                msg = payload
+                events.append(("log", f"[BROADCAST] {msg}"))
 
                 # Handle TIMEUP broadcast for showing winner
                 if "TIMEUP" in msg and "Winner=" in msg:
                     if f"Winner={my_username}" in msg:
-                        ev_queue.put(("result_message", f"🏆 You were the fastest!"))
+                        events.append(("result_message", f"🏆 You were the fastest!"))
                     elif "Winner=None" in msg:
-                        ev_queue.put(("result_message", "No one got it right"))
+                        events.append(("result_message", "No one got it right"))
                     else:
                         # Extract winner name
-                        match = re.search(r"Winner=(\w+)", msg)
+                        match = WINNER_RE.search(msg)
                         if match:
                             winner = match.group(1)
-                            ev_queue.put(("result_message", f"🥇 {winner} was fastest!"))
-                continue
+                            events.append(("result_message", f"🥇 {winner} was fastest!"))
 
             # ----- Scoreboard -----
-            if line.startswith("score:"):
-                payload = line.split(":", 1)[1]
-                ev_queue.put(("score", payload))
+            elif kind == "score":
+                events.append(("score", payload))
                 # Switch to results page ONLY after receiving scoreboard AND after user answered
                 # This ensures we show results after the question is complete
-                ev_queue.put(("show_results_now", None))
-                ev_queue.put(("log", "[SCOREBOARD UPDATED]"))
-                continue
+                events.append(("show_results_now", None))
+                events.append(("log", "[SCOREBOARD UPDATED]"))
 
             # ----- Error codes -----
-            if line.startswith("error:"):
-                code = line.split(":", 1)[1]
+            elif kind == "error":
+                code = payload
                 if code == "username_taken":
-                    ev_queue.put(("username_error", "This username is already taken. Please choose another one."))
-                    ev_queue.put(("log", "[ERROR] Username already taken"))
+                    events.append(("username_error", "This username is already taken. Please choose another one."))
+                    events.append(("log", "[ERROR] Username already taken"))
                 elif code == "ip_exists":
-                    ev_queue.put(("username_error", "This machine is already connected. Please use another device."))
-                    ev_queue.put(("log", "[ERROR] IP already connected"))
+                    events.append(("username_error", "This machine is already connected. Please use another device."))
+                    events.append(("log", "[ERROR] IP already connected"))
                 elif code == "lobby_full":
-                    ev_queue.put(("username_error", "The game already has the maximum number of players. Try again later."))
-                    ev_queue.put(("log", "[ERROR] Lobby full"))
+                    events.append(("username_error", "The game already has the maximum number of players. Try again later."))
+                    events.append(("log", "[ERROR] Lobby full"))
                 else:
-                    ev_queue.put(("log", f"[ERROR] {code}"))
-                continue
+                    events.append(("log", f"[ERROR] {code}"))
+
+            else:
+                events.append(("log", f"[SERVER MSG] {line}"))
 
-            ev_queue.put(("log", f"[SERVER MSG] {line}"))
+        del buffer[:start]
+        if events:
+            ev_queue.put(events)
+            events = []
+        wakeup.set()
 
-    ev_queue.put(("disconnected", None))
+    events.append(("disconnected", None))
+    ev_queue.put(events)
+    wakeup.set()
     try:
         sock.close()
     except OSError:
@@ -246,74 +428,85 @@ def listener_thread(
 
 def process_events() -> None:
     """Drain the event queue and update Streamlit session state."""
-    ev_queue: "queue.Queue[tuple]" = st.session_state.event_queue
-    
-    while True:
-        try:
-            kind, payload = ev_queue.get_nowait()
-        except queue.Empty:
-            break
-
+    ss = st.session_state  # Bound once; the loop below touches it per event
+    ev_queue: "queue.Queue[list]" = ss.event_queue
+    ss.events_ready.clear()
+
+    # Take everything that is pending in one critical section instead of
+    # one lock round-trip (and a final queue.Empty) per event. Each queued
+    # item is the list of events from one listener read.
+    with ev_queue.mutex:
+        batches = list(ev_queue.queue)
+        ev_queue.queue.clear()
+
+    for kind, payload in chain.from_iterable(batches):
+        # Most frequent kinds first: log lines and the per-second timer
         if kind == "log":
             append_log(payload)
+        elif kind == "timer":
+            ss.time_remaining = payload
         elif kind == "question":
             # When a new question arrives, force the page to "question" and clear everything
-            st.session_state.current_question = payload
-            st.session_state.last_answer = None
-            st.session_state.feedback = ""
-            st.session_state.result_message = ""
-            st.session_state.question_start_time = time.time()
-            st.session_state.current_page = "question"  # FORCE page to question
+            prepare_question(payload)
+            ss.current_question = payload
+            ss.last_answer = None
+            ss.feedback = ""
+            ss.feedback_kind = ""
+            ss.balloons_shown = False
+            ss.result_message = ""
+            ss.question_start_time = time.time()
+            ss.current_page = "question"  # FORCE page to question
             # Set timer to the specific timeout for this question
-            st.session_state.time_remaining = payload.get("timeout", 15)
-            st.session_state.question_timeout = payload.get("timeout", 15)
-        elif kind == "timer":
-            st.session_state.time_remaining = payload
+            ss.time_remaining = payload.get("timeout", 15)
+            ss.question_timeout = payload.get("timeout", 15)
         elif kind == "page":
             # Only allow page transitions to "question" - ignore all others
             if payload == "question":
-                st.session_state.current_page = payload
+                ss.current_page = payload
         elif kind == "clear_feedback":
             # Clear feedback when new question starts
-            st.session_state.feedback = ""
-            st.session_state.result_message = ""
-            st.session_state.last_points_earned = 0
+            ss.feedback = ""
+            ss.feedback_kind = ""
+            ss.result_message = ""
+            ss.last_points_earned = 0
         elif kind == "show_results_now":
             # Show results if we're on the question page and have a current question
             # (User may or may not have answered - could be timeout/skip)
-            if (st.session_state.current_page == "question" and
-                st.session_state.current_question is not None):
-                st.session_state.current_page = "results"
+            if (ss.current_page == "question" and
+                ss.current_question is not None):
+                ss.current_page = "results"
         elif kind == "feedback":
-            # Store feedback but DON'T change page - wait for score update
-            st.session_state.feedback = payload
+            # Store feedback but DON'T change page - wait for score update.
+            # The kind (correct/wrong/timeout) picks the results styling.
+            ss.feedback_kind, ss.feedback = payload
         elif kind == "result_message":
             # Store result message but DON'T change page - wait for score update
-            st.session_state.result_message = payload
+            ss.result_message = payload
         elif kind == "points":
-            st.session_state.last_points_earned = payload
+            ss.last_points_earned = payload
         elif kind == "correct":
             if payload:  # True = correct answer
-                st.session_state.total_correct += 1
-                st.session_state.answer_streak += 1
+                ss.total_correct += 1
+                ss.answer_streak += 1
             else:  # False = wrong answer
-                st.session_state.answer_streak = 0
-            st.session_state.total_answered += 1
+                ss.answer_streak = 0
+            ss.total_answered += 1
+            ss.accuracy = f"{ss.total_correct / ss.total_answered * 100:.0f}%"
         elif kind == "score":
             # Update scoreboard data but don't trigger page change here
             # The "show_results_now" event will handle page transition
             update_scoreboard_from_payload(payload)
         elif kind == "username_error":
-            st.session_state.username_error = payload
+            ss.username_error = payload
         elif kind == "disconnected":
             # Before disconnecting, show final leaderboard if we have scores
-            if st.session_state.scoreboard:
-                st.session_state.current_page = "final_results"
-                st.session_state.show_disconnect_message = True
+            if ss.scoreboard:
+                ss.current_page = "final_results"
+                ss.show_disconnect_message = True
             else:
-                st.session_state.connected = False
-                st.session_state.sock = None
-                st.session_state.listener_started = False
+                ss.connected = False
+                ss.sock = None
+                ss.listener_started = False
 
 
 # ---------- Streamlit App ----------
@@ -512,6 +705,34 @@ st.markdown("""
         animation: scaleIn 0.4s ease-out;
     }
 
+    /* Leaderboard rows */
+    .lb-row {
+        border-radius: 18px;
+        padding: 20px 30px;
+        margin: 16px 0;
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        box-shadow: 0 8px 20px rgba(0,0,0,0.25);
+        color: #1a202c;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        animation: fadeIn 0.6s ease-out both;
+    }
+    .lb-row .lb-player { display: flex; align-items: center; gap: 20px; }
+    .lb-row .lb-medal { font-size: 2rem; }
+    .lb-row .lb-rank { font-size: 1.1rem; font-weight: 700; opacity: 0.8; }
+    .lb-row .lb-name { font-size: 1.4rem; font-weight: 800; margin-left: 12px; }
+    .lb-row .lb-pts { font-size: 1.6rem; font-weight: 900; text-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+    .lb-gold { background: linear-gradient(135deg, #FFD700 0%, #FFA500 100%); border: 3px solid #FFD700; }
+    .lb-silver { background: linear-gradient(135deg, #C0C0C0 0%, #A8A8A8 100%); border: 3px solid #C0C0C0; }
+    .lb-bronze { background: linear-gradient(135deg, #CD7F32 0%, #B8732D 100%); border: 3px solid #CD7F32; }
+    .lb-default { background: rgba(255,255,255,0.95); border: 2px solid rgba(255,255,255,0.3); }
+    .lb-row.lb-me {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: 3px solid #a78bfa;
+    }
+
     /* Result feedback animation */
     .result-feedback {
         animation: pulse 0.6s ease-in-out;
@@ -536,53 +757,50 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Session state initialization
-if "sock" not in st.session_state:
-    st.session_state.sock = None
-if "connected" not in st.session_state:
-    st.session_state.connected = False
-if "current_question" not in st.session_state:
-    st.session_state.current_question = None
-if "scoreboard" not in st.session_state:
-    st.session_state.scoreboard = []
-if "log" not in st.session_state:
-    st.session_state.log = []
-if "last_answer" not in st.session_state:
-    st.session_state.last_answer = None
-if "feedback" not in st.session_state:
-    st.session_state.feedback = ""
-if "username_error" not in st.session_state:
-    st.session_state.username_error = ""
-if "my_username" not in st.session_state:
-    st.session_state.my_username = ""
-if "server_ip" not in st.session_state:
-    st.session_state.server_ip = "192.168.1.28"
-if "listener_started" not in st.session_state:
-    st.session_state.listener_started = False
-if "event_queue" not in st.session_state:
-    st.session_state.event_queue = queue.Queue()
-if "answer_streak" not in st.session_state:
-    st.session_state.answer_streak = 0
-if "total_correct" not in st.session_state:
-    st.session_state.total_correct = 0
-if "total_answered" not in st.session_state:
-    st.session_state.total_answered = 0
-if "question_start_time" not in st.session_state:
-    st.session_state.question_start_time = None
-if "current_page" not in st.session_state:
-    st.session_state.current_page = "waiting"  # waiting, question, results, leaderboard
-if "result_message" not in st.session_state:
-    st.session_state.result_message = ""
-if "last_points_earned" not in st.session_state:
-    st.session_state.last_points_earned = 0
-if "time_remaining" not in st.session_state:
-    st.session_state.time_remaining = 15
-if "question_timeout" not in st.session_state:
-    st.session_state.question_timeout = 15
-if "show_disconnect_message" not in st.session_state:
-    st.session_state.show_disconnect_message = False
+# Plain session defaults, set with one setdefault() per key
+SESSION_DEFAULTS = {
+    "sock": None,
+    "connected": False,
+    "current_question": None,
+    "last_answer": None,
+    "feedback": "",
+    "feedback_kind": "",  # correct, wrong or timeout once feedback arrives
+    "balloons_shown": False,  # Celebrated this question's correct answer
+    "username_error": "",
+    "my_username": "",
+    "server_ip": "192.168.1.28",
+    "listener_started": False,
+    "answer_streak": 0,
+    "total_correct": 0,
+    "total_answered": 0,
+    "accuracy": "0%",  # Formatted once per answer for the stats metrics
+    "question_start_time": None,
+    "current_page": "waiting",  # waiting, question, results, leaderboard
+    "result_message": "",
+    "last_points_earned": 0,
+    "time_remaining": 15,
+    "question_timeout": 15,
+    "show_disconnect_message": False,
+}
+# Defaults that must be a new object per session, built only when missing
+SESSION_FACTORIES = {
+    "scoreboard": list,
+    "log": lambda: deque(maxlen=LOG_MAX_LINES),
+    "event_queue": queue.Queue,
+    "events_ready": threading.Event,
+}
+
+for key, value in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, value)
+for key, factory in SESSION_FACTORIES.items():
+    if key not in st.session_state:
+        st.session_state[key] = factory()
 
 process_events()
 
+# Bound once per rerun; the render code below reads it many times
+ss = st.session_state
+
 # 🎮 Header
 st.markdown("""
     <div style='text-align: center; padding-bottom: 30px;'>
@@ -599,23 +817,22 @@ st.markdown("""
 with st.sidebar:
     st.markdown("<h1 style='font-family: \"Montserrat\", sans-serif; font-weight: 900; text-align: center;'>Lobby</h1>", unsafe_allow_html=True)
     
-    if st.session_state.connected:
+    if ss.connected:
         st.markdown(f"""
             <div style='background: #26890C; color: white; padding: 15px; border-radius: 8px; text-align: center; margin-bottom: 20px;'>
                 <h3 style='margin: 0; font-weight: 700;'>Connected</h3>
-                <p style='margin: 5px 0 0 0;'>Playing as <b>{st.session_state.my_username}</b></p>
+                <p style='margin: 5px 0 0 0;'>Playing as <b>{ss.my_username}</b></p>
             </div>
         """, unsafe_allow_html=True)
         
         st.markdown("### Your Stats")
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Correct", st.session_state.total_correct)
-            st.metric("Streak", st.session_state.answer_streak)
+            st.metric("Correct", ss.total_correct)
+            st.metric("Streak", ss.answer_streak)
         with col2:
-            accuracy = (st.session_state.total_correct / st.session_state.total_answered * 100) if st.session_state.total_answered > 0 else 0
-            st.metric("Accuracy", f"{accuracy:.0f}%")
-            st.metric("Answered", st.session_state.total_answered)
+            st.metric("Accuracy", ss.accuracy)
+            st.metric("Answered", ss.total_answered)
     else:
         st.markdown("""
             <div style='background: #6366f1; color: white; padding: 15px; border-radius: 8px; text-align: center; margin-bottom: 20px;'>
@@ -623,117 +840,106 @@ with st.sidebar:
             </div>
         """, unsafe_allow_html=True)
 
-    server_ip = st.text_input("Server IP", value=st.session_state.server_ip, disabled=st.session_state.connected)
-    username = st.text_input("Username", value=st.session_state.my_username, disabled=st.session_state.connected, max_chars=20)
+    server_ip = st.text_input("Server IP", value=ss.server_ip, disabled=ss.connected)
+    username = st.text_input("Username", value=ss.my_username, disabled=ss.connected, max_chars=20)
 
-    if not st.session_state.connected:
+    if not ss.connected:
         connect_btn = st.button("Join Game", type="primary", use_container_width=True)
         
         if connect_btn:
-            st.session_state.username_error = ""
+            ss.username_error = ""
             
             if not server_ip.strip() or not username.strip():
-                st.session_state.username_error = "Server IP and Username are required."
+                ss.username_error = "Server IP and Username are required."
             else:
                 try:
                     sock_obj = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                     sock_obj.connect((server_ip.strip(), DEFAULT_PORT))
-                    st.session_state.sock = sock_obj
-                    st.session_state.server_ip = server_ip.strip()
-                    st.session_state.my_username = username.strip()
-                    st.session_state.connected = True
+                    # Send answers immediately instead of waiting on Nagle
+                    sock_obj.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    ss.sock = sock_obj
+                    ss.server_ip = server_ip.strip()
+                    ss.my_username = username.strip()
+                    ss.connected = True
                     
                     append_log(f"[CONNECTED to {server_ip.strip()}:{DEFAULT_PORT} as {username.strip()}]")
                     send_line(sock_obj, f"join:{username.strip()}")
                     append_log(f"[JOIN SENT as {username.strip()}]")
                     
-                    if not st.session_state.listener_started:
+                    if not ss.listener_started:
                         thread = threading.Thread(
                             target=listener_thread,
-                            args=(sock_obj, username.strip(), st.session_state.event_queue),
+                            args=(
+                                sock_obj,
+                                username.strip(),
+                                ss.event_queue,
+                                ss.events_ready,
+                            ),
                             daemon=True,
                         )
                         thread.start()
-                        st.session_state.listener_started = True
+                        ss.listener_started = True
                         
                 except OSError as exc:
-                    st.session_state.username_error = f"Connection error: {exc}"
+                    ss.username_error = f"Connection error: {exc}"
                     append_log(f"[ERROR connecting: {exc}]")
-                    st.session_state.connected = False
-                    st.session_state.sock = None
+                    ss.connected = False
+                    ss.sock = None
     else:
         # Disconnect button when connected
         st.markdown("---")
         if st.button("Disconnect", type="secondary", use_container_width=True):
             # Show final results page instead of immediate disconnect
-            if st.session_state.scoreboard:
-                st.session_state.current_page = "final_results"
-                st.session_state.show_disconnect_message = True
-                if st.session_state.sock:
-                    try:
-                        st.session_state.sock.close()
-                    except:
-                        pass
-                st.session_state.sock = None
-                st.session_state.listener_started = False
+            if ss.scoreboard:
+                ss.current_page = "final_results"
+                ss.show_disconnect_message = True
+                if ss.sock:
+                    close_socket(ss.sock)
+                ss.sock = None
+                ss.listener_started = False
             else:
                 # No scores yet, disconnect immediately
-                if st.session_state.sock:
-                    try:
-                        st.session_state.sock.close()
-                    except:
-                        pass
-                st.session_state.connected = False
-                st.session_state.sock = None
-                st.session_state.listener_started = False
+                if ss.sock:
+                    close_socket(ss.sock)
+                ss.connected = False
+                ss.sock = None
+                ss.listener_started = False
                 st.success("Disconnected from server")
                 time.sleep(1)
             
-            if hasattr(st, "rerun"):
-                st.rerun()
-            else:
-                st.experimental_rerun()
+            rerun()
 
-    if st.session_state.username_error:
-        st.error(st.session_state.username_error)
+    if ss.username_error:
+        st.error(ss.username_error)
 
 # ===================== MAIN LAYOUT =====================
+# The sidebar above may have joined or left; nothing below changes these
+connected, page = ss.connected, ss.current_page
+
 col_main = st.container()
 
 with col_main:
     # MULTI-PAGE FLOW: Question → Results → Leaderboard
       # PAGE 1: QUESTION PAGE
-    if st.session_state.connected and st.session_state.current_page == "question" and st.session_state.current_question:
+    if connected and page == "question" and ss.current_question:
         # Force default background during question phase
-        st.markdown("""
-            <style>
-                .stApp {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                }
-            </style>
-        """, unsafe_allow_html=True)
+        st.markdown(DEFAULT_BACKGROUND_STYLE, unsafe_allow_html=True)
         
-        question = st.session_state.current_question
-        stem = question["stem"]
-        opts = question["options"]
-
-        # Extract option texts from the stem if they are embedded (e.g., "A) TCP B) UDP ...")
-        cleaned_stem, options_map, labels_in_stem = parse_question_text_and_options(stem)
+        question = ss.current_question
+        # Display text and buttons were worked out once by prepare_question()
+        cleaned_stem = question["text"]
         
         # Timer Display with premium styling
-        time_remaining = st.session_state.time_remaining
-        question_timeout = st.session_state.question_timeout
+        time_remaining = ss.time_remaining
+        question_timeout = ss.question_timeout
         
         # Dynamic color based on time
         if time_remaining > (question_timeout * 0.66):
-            timer_color = "#10b981"
-            timer_bg = "linear-gradient(135deg, #10b981, #059669)"
+            timer_color, timer_bg = TIMER_STYLES[2]
         elif time_remaining > (question_timeout * 0.33):
-            timer_color = "#f59e0b"
-            timer_bg = "linear-gradient(135deg, #f59e0b, #d97706)"
+            timer_color, timer_bg = TIMER_STYLES[1]
         else:
-            timer_color = "#ef4444"
-            timer_bg = "linear-gradient(135deg, #ef4444, #dc2626)"
+            timer_color, timer_bg = TIMER_STYLES[0]
         
         progress_percent = (time_remaining / question_timeout) * 100 if question_timeout > 0 else 0
         
@@ -763,58 +969,23 @@ with col_main:
             </div>
         """, unsafe_allow_html=True)
 
-        # Determine options
-        if opts is not None and isinstance(opts, (list, tuple)) and len(opts) > 0:
-            all_labels = ["A", "B", "C", "D"]
-            labels = all_labels[: len(opts)]
-            # Build map from provided opts if server sent them separately
-            options_map = {label: str(opts[i]) for i, label in enumerate(labels)}
-        else:
-            # Prefer labels detected in the stem via the parser
-            labels = labels_in_stem if labels_in_stem else ["A", "B", "C", "D"]
-
         # Answer Buttons (2x2 grid) - only show if not answered
-        if st.session_state.last_answer is None:
-            # Create a list of labels and options
-            options_with_labels = []
-            # Build from parsed/provided options if available; otherwise show generic labels
-            if options_map:
-                for label in labels:
-                    if label in options_map:
-                        options_with_labels.append((label, options_map[label]))
-            if not options_with_labels:
-                for label in labels:
-                    options_with_labels.append((label, f"Option {label}"))
-
-            # Display buttons in a 2x2 grid
+        if ss.last_answer is None:
+            options_with_labels = question["buttons"]
+
+            # Display buttons in a 2x2 grid. Each option stays a single
+            # click (no form + submit) since answer speed is scored.
             for i in range(0, len(options_with_labels), 2):
-                col1, col2 = st.columns(2)
-                
-                # Button 1
-                with col1:
-                    label, text = options_with_labels[i]
+                row = options_with_labels[i:i + 2]
+                for col, (label, text) in zip(st.columns(2), row):
                     # Show the option text on the colored button; still send the label
-                    if st.button(f"{text}", key=f"btn_{label}", use_container_width=True):
-                        if st.session_state.sock and st.session_state.last_answer is None:
-                            send_line(st.session_state.sock, f"answer:{label}")
-                            st.session_state.last_answer = label
-                            append_log(f"[ANSWER SENT '{label}']")
-                            st.balloons()
-                            if hasattr(st, "rerun"): st.rerun()
-                            else: st.experimental_rerun()
-
-                # Button 2 (if it exists)
-                if i + 1 < len(options_with_labels):
-                    with col2:
-                        label, text = options_with_labels[i+1]
-                        if st.button(f"{text}", key=f"btn_{label}", use_container_width=True):
-                            if st.session_state.sock and st.session_state.last_answer is None:
-                                send_line(st.session_state.sock, f"answer:{label}")
-                                st.session_state.last_answer = label
-                                append_log(f"[ANSWER SENT '{label}']")
-                                st.balloons()
-                                if hasattr(st, "rerun"): st.rerun()
-                                else: st.experimental_rerun()
+                    col.button(
+                        f"{text}",
+                        key=f"btn_{label}",
+                        use_container_width=True,
+                        on_click=submit_answer,
+                        args=(label,),
+                    )
         else:
             # Show "answer locked in" message with premium styling
             st.markdown(f"""
@@ -828,7 +999,7 @@ with col_main:
                         Answer Locked!
                     </h2>
                     <p style='margin: 12px 0 0 0; opacity: 0.95; font-size: 18px; font-weight: 600;'>
-                        You selected: <span style='font-size: 24px; font-weight: 900;'>{st.session_state.last_answer}</span>
+                        You selected: <span style='font-size: 24px; font-weight: 900;'>{ss.last_answer}</span>
                     </p>
                     <div class='loader' style='margin-top: 20px;'></div>
                     <p style='margin: 8px 0 0 0; opacity: 0.9; font-size: 16px;'>Waiting for results...</p>
@@ -836,17 +1007,14 @@ with col_main:
             """, unsafe_allow_html=True)
     
     # PAGE 2: UNIFIED RESULTS & LEADERBOARD PAGE
-    elif st.session_state.connected and st.session_state.current_page == "results":
+    elif connected and page == "results":
         # Dynamic background based on result
-        if st.session_state.feedback:
-            if "CORRECT" in st.session_state.feedback:
-                bg_gradient = "linear-gradient(135deg, #10b981 0%, #059669 100%)"
-            elif "Wrong" in st.session_state.feedback:
-                bg_gradient = "linear-gradient(135deg, #ef4444 0%, #dc2626 100%)"
-            else:
-                bg_gradient = "linear-gradient(135deg, #f59e0b 0%, #d97706 100%)"
-        else:
-            bg_gradient = "linear-gradient(135deg, #667eea 0%, #764ba2 100%)"
+        feedback_icon, bg_gradient = FEEDBACK_STYLES.get(ss.feedback_kind, DEFAULT_FEEDBACK_STYLE)
+
+        # Celebrate a correct answer once, off the answer-click path
+        if ss.feedback_kind == "correct" and not ss.balloons_shown:
+            st.balloons()
+            ss.balloons_shown = True
 
         st.markdown(f"""
             <style>
@@ -863,25 +1031,23 @@ with col_main:
         """, unsafe_allow_html=True)
 
         # Feedback Section with premium animation
-        if st.session_state.feedback:
-            feedback_icon = "🎉" if "CORRECT" in st.session_state.feedback else ("💔" if "Wrong" in st.session_state.feedback else "⏰")
-            
+        if ss.feedback:
             st.markdown(f"""
                 <div class='result-feedback' style='margin-bottom: 2rem;'>
                     <div style='font-size: 80px; animation: bounce 0.8s ease-in-out; margin-bottom: 1rem;'>{feedback_icon}</div>
                     <h1 style='font-size: 3.5rem; font-weight: 900; margin: 0; text-shadow: 0 6px 12px rgba(0,0,0,0.4); 
-                         letter-spacing: 1px;'>{st.session_state.feedback}</h1>
+                         letter-spacing: 1px;'>{ss.feedback}</h1>
                 </div>
             """, unsafe_allow_html=True)
         
         # Winner/Result Message
-        if st.session_state.result_message:
+        if ss.result_message:
             st.markdown(f"""
                 <div style='background: rgba(255,255,255,0.2); backdrop-filter: blur(10px); 
                      padding: 20px 40px; border-radius: 20px; display: inline-block; margin-bottom: 3rem;
                      box-shadow: 0 8px 24px rgba(0,0,0,0.2); animation: scaleIn 0.5s ease-out;'>
                     <p style='font-size: 1.5rem; font-weight: 700; margin: 0; text-shadow: 0 2px 4px rgba(0,0,0,0.2);'>
-                        {st.session_state.result_message}
+                        {ss.result_message}
                     </p>
                 </div>
             """, unsafe_allow_html=True)
@@ -900,58 +1066,27 @@ with col_main:
                 </h2>
         """, unsafe_allow_html=True)
         
-        if st.session_state.scoreboard:
-            # Display top 5 players with premium styling
-            for idx, (rank, uname, pts) in enumerate(st.session_state.scoreboard[:5]):
-                medal = ""
-                rank_bg = "rgba(255,255,255,0.95)"
-                
-                if rank == 1: 
-                    medal = "🥇"
-                    rank_bg = "linear-gradient(135deg, #FFD700 0%, #FFA500 100%)"
-                    text_color = "#1a202c"
-                    border = "3px solid #FFD700"
-                elif rank == 2: 
-                    medal = "🥈"
-                    rank_bg = "linear-gradient(135deg, #C0C0C0 0%, #A8A8A8 100%)"
-                    text_color = "#1a202c"
-                    border = "3px solid #C0C0C0"
-                elif rank == 3: 
-                    medal = "🥉"
-                    rank_bg = "linear-gradient(135deg, #CD7F32 0%, #B8732D 100%)"
-                    text_color = "#1a202c"
-                    border = "3px solid #CD7F32"
-                else:
-                    text_color = "#1a202c"
-                    border = "2px solid rgba(255,255,255,0.3)"
-                
+        if ss.scoreboard:
+            # Display top 5 players with premium styling, sent to the page
+            # as one markdown element instead of one element per row
+            rows_html = []
+            for idx, (rank, uname, pts) in enumerate(ss.scoreboard[:5]):
+                medal, row_class = RANK_STYLES.get(rank, DEFAULT_RANK_STYLE)
                 # Highlight current user
-                if uname == st.session_state.my_username:
-                    rank_bg = "linear-gradient(135deg, #667eea 0%, #764ba2 100%)"
-                    text_color = "white"
-                    border = "3px solid #a78bfa"
-                
-                # Staggered animation delay
-                animation_delay = idx * 0.1
-                
-                st.markdown(f"""
-                    <div style='background: {rank_bg}; color: {text_color}; border-radius: 18px; 
-                         padding: 20px 30px; margin: 16px 0; display: flex; justify-content: space-between; 
-                         align-items: center; box-shadow: 0 8px 20px rgba(0,0,0,0.25); border: {border};
-                         transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-                         animation: fadeIn 0.6s ease-out {animation_delay}s both;'>
-                        <div style='display: flex; align-items: center; gap: 20px;'>
-                            <span style='font-size: 2rem;'>{medal}</span>
-                            <div>
-                                <span style='font-size: 1.1rem; font-weight: 700; opacity: 0.8;'>#{rank}</span>
-                                <span style='font-size: 1.4rem; font-weight: 800; margin-left: 12px;'>{uname}</span>
-                            </div>
-                        </div>
-                        <span style='font-size: 1.6rem; font-weight: 900; text-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
-                            {pts} pts
-                        </span>
-                    </div>
-                """, unsafe_allow_html=True)
+                if uname == ss.my_username:
+                    row_class = f"{row_class} {MY_RANK_CLASS}"
+
+                # Styling comes from the .lb-* classes; only the
+                # staggered animation delay differs per row
+                rows_html.append(
+                    f"<div class='lb-row {row_class}' style='animation-delay: {idx * 0.1}s;'>"
+                    f"<div class='lb-player'><span class='lb-medal'>{medal}</span>"
+                    f"<div><span class='lb-rank'>#{rank}</span>"
+                    f"<span class='lb-name'>{uname}</span></div></div>"
+                    f"<span class='lb-pts'>{pts} pts</span>"
+                    f"</div>"
+                )
+            st.markdown("".join(rows_html), unsafe_allow_html=True)
         else:
             st.markdown("""
                 <p style='text-align: center; color: rgba(255,255,255,0.8); font-size: 1.2rem; padding: 20px;'>
@@ -962,38 +1097,19 @@ with col_main:
         st.markdown("</div>", unsafe_allow_html=True)
     
     # PAGE 3: LEADERBOARD PAGE (now only used for final summary)
-    elif st.session_state.connected and st.session_state.current_page == "leaderboard":
+    elif connected and page == "leaderboard":
         # Restore default gradient background
-        st.markdown("""
-            <style>
-                .stApp {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                }
-            </style>
-        """, unsafe_allow_html=True)
+        st.markdown(DEFAULT_BACKGROUND_STYLE, unsafe_allow_html=True)
         
-        st.markdown("""
-            <div style='text-align: center; padding: 80px 40px; background: rgba(255,255,255,0.15); 
-                 backdrop-filter: blur(20px); color: white; border-radius: 30px; 
-                 box-shadow: 0 20px 60px rgba(0,0,0,0.3); max-width: 700px; margin: 40px auto;
-                 animation: scaleIn 0.6s ease-out;'>
-                <div class='loader' style='margin: 0 auto 30px;'></div>
-                <h1 style='font-family: "Montserrat", sans-serif; font-weight: 900; font-size: 48px; 
-                     margin-bottom: 20px; text-shadow: 0 4px 8px rgba(0,0,0,0.3);'>Get Ready!</h1>
-                <p style='font-size: 22px; opacity: 0.9;'>The next question is coming up...</p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(GET_READY_CARD.format(
+            margin=40, title_size=48, message_size=22, message_weight="normal",
+            message="The next question is coming up...",
+        ), unsafe_allow_html=True)
 
     # PAGE 4: FINAL RESULTS (shown when disconnected or quiz ends)
-    elif st.session_state.current_page == "final_results":
+    elif page == "final_results":
         # Restore default background
-        st.markdown("""
-            <style>
-                .stApp {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                }
-            </style>
-        """, unsafe_allow_html=True)
+        st.markdown(DEFAULT_BACKGROUND_STYLE, unsafe_allow_html=True)
         st.markdown("""
             <div style='text-align: center; padding: 40px 20px; background: white; color: #333;
                  border-radius: 16px; box-shadow: 0 8px 16px rgba(0,0,0,0.2);'>
@@ -1003,34 +1119,42 @@ with col_main:
         """, unsafe_allow_html=True)
         
         # Show disconnect message if applicable
-        if st.session_state.show_disconnect_message:
+        if ss.show_disconnect_message:
             st.warning("You have been disconnected from the server")
         
         # Show final leaderboard
-        if st.session_state.scoreboard:
-            # Podium
-            podium = st.session_state.scoreboard[:3]
-            cols = st.columns(len(podium))
-            for i, (rank, uname, pts) in enumerate(podium):
-                with cols[i]:
-                    if rank == 1:
-                        st.markdown(f"<h2 style='text-align: center;'>🥇 1st</h2>", unsafe_allow_html=True)
-                        st.markdown(f"<h3 style='text-align: center; color: #D89E00;'>{uname}</h3>", unsafe_allow_html=True)
-                        st.markdown(f"<h4 style='text-align: center;'>{pts} pts</h4>", unsafe_allow_html=True)
-                    elif rank == 2:
-                        st.markdown(f"<h2 style='text-align: center;'>� 2nd</h2>", unsafe_allow_html=True)
-                        st.markdown(f"<h3 style='text-align: center; color: #C0C0C0;'>{uname}</h3>", unsafe_allow_html=True)
-                        st.markdown(f"<h4 style='text-align: center;'>{pts} pts</h4>", unsafe_allow_html=True)
-                    elif rank == 3:
-                        st.markdown(f"<h2 style='text-align: center;'>🥉 3rd</h2>", unsafe_allow_html=True)
-                        st.markdown(f"<h3 style='text-align: center; color: #CD7F32;'>{uname}</h3>", unsafe_allow_html=True)
-                        st.markdown(f"<h4 style='text-align: center;'>{pts} pts</h4>", unsafe_allow_html=True)
+        if ss.scoreboard:
+            # Podium: one flex row of the top three, sent as a single
+            # markdown element instead of three columns of three elements
+            podium_html = "".join(
+                f"<div style='flex: 1; text-align: center;'>"
+                f"<h2>{PODIUM_STYLES[rank][0]}</h2>"
+                f"<h3 style='color: {PODIUM_STYLES[rank][1]};'>{uname}</h3>"
+                f"<h4>{pts} pts</h4>"
+                f"</div>"
+                for rank, uname, pts in ss.scoreboard[:3]
+                if rank in PODIUM_STYLES
+            )
+            st.markdown(
+                f"<div style='display: flex; gap: 1rem;'>{podium_html}</div>",
+                unsafe_allow_html=True,
+            )
             
-            # Rest of leaderboard
-            if len(st.session_state.scoreboard) > 3:
+            # Rest of leaderboard; long tails are folded into an expander
+            if len(ss.scoreboard) > 3:
                 st.markdown("---")
-                for rank, uname, pts in st.session_state.scoreboard[3:]:
-                     st.markdown(f"**#{rank}** {uname} - {pts} pts")
+                visible_end = 3 + FINAL_VISIBLE_ROWS
+                st.markdown("  \n".join(
+                    f"**#{rank}** {uname} - {pts} pts"
+                    for rank, uname, pts in ss.scoreboard[3:visible_end]
+                ))
+                remaining = ss.scoreboard[visible_end:]
+                if remaining:
+                    with st.expander(f"Show remaining {len(remaining)} players"):
+                        st.markdown("  \n".join(
+                            f"**#{rank}** {uname} - {pts} pts"
+                            for rank, uname, pts in remaining
+                        ))
 
         
         # Show personal stats
@@ -1038,37 +1162,26 @@ with col_main:
         st.markdown("<h3 style='text-align: center;'>Your Final Stats</h3>", unsafe_allow_html=True)
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Correct", st.session_state.total_correct)
+            st.metric("Correct", ss.total_correct)
         with col2:
-            accuracy = (st.session_state.total_correct / st.session_state.total_answered * 100) if st.session_state.total_answered > 0 else 0
-            st.metric("Accuracy", f"{accuracy:.0f}%")
+            st.metric("Accuracy", ss.accuracy)
         with col3:
-            st.metric("Best Streak", st.session_state.answer_streak)
+            st.metric("Best Streak", ss.answer_streak)
         
         st.markdown("---")
         
         # Return to lobby button
         if st.button("Return to Lobby", type="primary", use_container_width=True):
             # Reset all session state variables to their defaults
-            st.session_state.clear()
-            if hasattr(st, "rerun"):
-                st.rerun()
-            else:
-                st.experimental_rerun()
+            ss.clear()
+            rerun()
 
-    elif st.session_state.connected:
+    elif connected:
         # Waiting room (default state between questions)
-        st.markdown("""
-            <div style='text-align: center; padding: 80px 40px; background: rgba(255,255,255,0.15); 
-                 backdrop-filter: blur(20px); color: white; border-radius: 30px; 
-                 box-shadow: 0 20px 60px rgba(0,0,0,0.3); max-width: 700px; margin: 80px auto;
-                 animation: scaleIn 0.6s ease-out;'>
-                <div class='loader' style='margin: 0 auto 30px;'></div>
-                <h1 style='font-family: "Montserrat", sans-serif; font-weight: 900; font-size: 52px; 
-                     margin-bottom: 20px; text-shadow: 0 4px 8px rgba(0,0,0,0.3);'>Get Ready!</h1>
-                <p style='font-size: 24px; opacity: 0.9; font-weight: 600;'>Waiting for the next question...</p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(GET_READY_CARD.format(
+            margin=80, title_size=52, message_size=24, message_weight=600,
+            message="Waiting for the next question...",
+        ), unsafe_allow_html=True)
     else:
         # Welcome screen
         st.markdown("""
@@ -1098,11 +1211,24 @@ with col_main:
             </div>
         """, unsafe_allow_html=True)
 
-# Auto-rerun loop
-if st.session_state.connected:
-    time.sleep(0.2)
-    if hasattr(st, "rerun"):
-        st.rerun()
-    else:
-        st.experimental_rerun()
-
+# Auto-refresh: poll for listener events in a fragment where available;
+# otherwise wake as soon as events are queued or after a short idle timeout
+# (shorter while answer buttons are shown) and rerun the whole script
+if connected and hasattr(st, "fragment"):
+    # Only this small fragment reruns on a timer. The full page reruns
+    # only once the listener thread has actually queued events.
+    @st.fragment(run_every=EVENT_POLL_INTERVAL)
+    def poll_events() -> None:
+        if st.session_state.events_ready.is_set():
+            st.rerun()
+
+    poll_events()
+elif connected:
+    awaiting_answer = (
+        page == "question"
+        and ss.last_answer is None
+    )
+    ss.events_ready.wait(
+        ANSWER_RERUN_INTERVAL if awaiting_answer else IDLE_RERUN_INTERVAL
+    )
+    rerun()
@@ -19,9 +19,9 @@ Usage:
     - Answer questions with A, B, C, or D
 """
 
+import re
 import socket
 import threading
-import time
 import sys
 import os
 
@@ -44,6 +44,13 @@ except ImportError:
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8888
 ENCODING = "utf-8"
+RECV_SIZE = 65536  # Large enough to drain a whole burst of lines in one read
+# Answer lines are fixed, so they are encoded once instead of on every send
+ANSWER_LINES = {label: f"answer:{label}\n".encode(ENCODING) for label in "ABCD"}
+# How long input_loop waits for a question before re-checking running
+INPUT_WAIT_TIMEOUT = 1.0
+# Fields of "TIMEUP Correct=A Winner=user1 Points=950"; Winner/Points may be absent
+TIMEUP_RE = re.compile(r"Correct=(\S+)(?:\s+Winner=(\S+))?(?:\s+Points=(\S+))?")
 
 # Client state
 sock = None
@@ -55,6 +62,11 @@ timer_value = 0
 answered = False
 waiting_for_results = False
 my_username = ""
+# Set by receive_loop while a question is open for an answer; input_loop
+# blocks on it instead of polling the flags above
+question_ready = threading.Event()
+# (filled, color) of the timer bar currently on screen; None after a redraw
+last_timer_bar = None
 
 
 def clear_screen():
@@ -62,38 +74,70 @@ def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
-def print_header():
-    """Print the game header."""
-    print(Fore.CYAN + Style.BRIGHT + "╔════════════════════════════════════════════════════════╗")
-    print(Fore.CYAN + Style.BRIGHT + "║                                                        ║")
-    print(Fore.CYAN + Style.BRIGHT + "║        🎮 QUIZNET - KAHOOT-STYLE TCP CLIENT 🎮        ║")
-    print(Fore.CYAN + Style.BRIGHT + "║                                                        ║")
-    print(Fore.CYAN + Style.BRIGHT + "║           Transport Layer Quiz Competition            ║")
-    print(Fore.CYAN + Style.BRIGHT + "║                                                        ║")
-    print(Fore.CYAN + Style.BRIGHT + "╚════════════════════════════════════════════════════════╝")
-    print()
+def format_lines(lines):
+    """
+    Join output lines into one string ready to write.
+    
+    Each line ends with a style reset, as print() gets from colorama's
+    autoreset, so a color never bleeds into the next line.
+    """
+    return "".join(f"{line}{Style.RESET_ALL}\n" for line in lines)
+
+
+def write_text(text):
+    """Write already-rendered text with one write and one flush."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def separator(char="═", length=60, color=Fore.CYAN):
+    """Return a separator line."""
+    return color + char * length
+
+
+def render_header():
+    """Return the game header."""
+    return format_lines([
+        Fore.CYAN + Style.BRIGHT + "╔════════════════════════════════════════════════════════╗",
+        Fore.CYAN + Style.BRIGHT + "║                                                        ║",
+        Fore.CYAN + Style.BRIGHT + "║        🎮 QUIZNET - KAHOOT-STYLE TCP CLIENT 🎮        ║",
+        Fore.CYAN + Style.BRIGHT + "║                                                        ║",
+        Fore.CYAN + Style.BRIGHT + "║           Transport Layer Quiz Competition            ║",
+        Fore.CYAN + Style.BRIGHT + "║                                                        ║",
+        Fore.CYAN + Style.BRIGHT + "╚════════════════════════════════════════════════════════╝",
+        "",
+    ])
 
 
 def print_separator(char="═", length=60, color=Fore.CYAN):
     """Print a separator line."""
-    print(color + char * length)
+    print(separator(char, length, color))
 
 
-def print_question_box(question_text, question_num, timeout):
-    """Display the current question in a nice box."""
-    print()
-    print_separator("━", 60, Fore.YELLOW)
-    print(Fore.YELLOW + Style.BRIGHT + f"📝 QUESTION {question_num}")
-    print_separator("━", 60, Fore.YELLOW)
-    print()
-    print(Fore.WHITE + Style.BRIGHT + question_text)
-    print()
-    print(Fore.CYAN + f"⏱️  Time limit: {timeout} seconds")
-    print()
+def render_question_box(question_text, question_num, timeout):
+    """Return the current question in a nice box."""
+    return format_lines([
+        "",
+        separator("━", 60, Fore.YELLOW),
+        Fore.YELLOW + Style.BRIGHT + f"📝 QUESTION {question_num}",
+        separator("━", 60, Fore.YELLOW),
+        "",
+        Fore.WHITE + Style.BRIGHT + question_text,
+        "",
+        Fore.CYAN + f"⏱️  Time limit: {timeout} seconds",
+        "",
+    ])
 
 
-def print_timer(seconds_left):
-    """Print the countdown timer."""
+def render_timer(seconds_left):
+    """
+    Return the countdown timer line.
+    
+    When the bar looks the same as last time, only the seconds in front of
+    it are rewritten and the bar already on screen is left in place.
+    """
+    global last_timer_bar
+    
     if seconds_left <= 3:
         color = Fore.RED
         icon = "⚠️ "
@@ -107,59 +151,76 @@ def print_timer(seconds_left):
     # Create a progress bar
     total_bars = 30
     filled = int((seconds_left / question_timeout) * total_bars)
-    bar = "█" * filled + "░" * (total_bars - filled)
     
-    print(f"\r{color}{icon}Time: {seconds_left:2d}s [{bar}] ", end="", flush=True)
-
-
-def print_results(winner, correct_answer, points=None):
-    """Display the results after a question."""
-    print("\n")
-    print_separator("═", 60, Fore.MAGENTA)
-    print(Fore.MAGENTA + Style.BRIGHT + "📊 RESULTS")
-    print_separator("═", 60, Fore.MAGENTA)
-    print()
+    if (filled, color) == last_timer_bar:
+        return f"\r{color}{icon}Time: {seconds_left:2d}s"
     
-    print(Fore.CYAN + Style.BRIGHT + f"✅ Correct Answer: {correct_answer}")
-    print()
+    last_timer_bar = (filled, color)
+    bar = "█" * filled + "░" * (total_bars - filled)
+    return f"\r{color}{icon}Time: {seconds_left:2d}s [{bar}] "
+
+
+def render_results(winner, correct_answer, points=None):
+    """Return the results after a question."""
+    lines = [
+        "\n",
+        separator("═", 60, Fore.MAGENTA),
+        Fore.MAGENTA + Style.BRIGHT + "📊 RESULTS",
+        separator("═", 60, Fore.MAGENTA),
+        "",
+        Fore.CYAN + Style.BRIGHT + f"✅ Correct Answer: {correct_answer}",
+        "",
+    ]
     
     if winner and winner != "None":
-        print(Fore.YELLOW + Style.BRIGHT + f"🏆 Winner: {winner}")
+        lines.append(Fore.YELLOW + Style.BRIGHT + f"🏆 Winner: {winner}")
         if points:
-            print(Fore.GREEN + Style.BRIGHT + f"   Points: {points}")
+            lines.append(Fore.GREEN + Style.BRIGHT + f"   Points: {points}")
     else:
-        print(Fore.YELLOW + "No one answered correctly")
-    print()
+        lines.append(Fore.YELLOW + "No one answered correctly")
+    lines.append("")
+    return format_lines(lines)
 
 
-def print_feedback(result, points, time_taken):
-    """Display personal feedback."""
+def render_feedback(result, points, time_taken):
+    """Return personal feedback."""
     if result == "correct":
-        print(Fore.GREEN + Style.BRIGHT + "═" * 60)
-        print(Fore.GREEN + Style.BRIGHT + f"✅ CORRECT! You earned {points} points!")
-        print(Fore.GREEN + f"⚡ Answer time: {time_taken}s")
-        print(Fore.GREEN + Style.BRIGHT + "═" * 60)
+        lines = [
+            Fore.GREEN + Style.BRIGHT + "═" * 60,
+            Fore.GREEN + Style.BRIGHT + f"✅ CORRECT! You earned {points} points!",
+            Fore.GREEN + f"⚡ Answer time: {time_taken}s",
+            Fore.GREEN + Style.BRIGHT + "═" * 60,
+        ]
     elif result == "wrong":
-        print(Fore.RED + Style.BRIGHT + "═" * 60)
-        print(Fore.RED + Style.BRIGHT + "❌ WRONG! Better luck next time!")
-        print(Fore.RED + Style.BRIGHT + "═" * 60)
+        lines = [
+            Fore.RED + Style.BRIGHT + "═" * 60,
+            Fore.RED + Style.BRIGHT + "❌ WRONG! Better luck next time!",
+            Fore.RED + Style.BRIGHT + "═" * 60,
+        ]
     elif result == "timeout":
-        print(Fore.YELLOW + Style.BRIGHT + "═" * 60)
-        print(Fore.YELLOW + Style.BRIGHT + "⏰ TIME'S UP! You didn't answer in time.")
-        print(Fore.YELLOW + Style.BRIGHT + "═" * 60)
-    print()
-
-
-def print_leaderboard(scores_data):
-    """Display the leaderboard."""
-    print()
-    print_separator("═", 60, Fore.CYAN)
-    print(Fore.CYAN + Style.BRIGHT + "🏆 LEADERBOARD")
-    print_separator("═", 60, Fore.CYAN)
-    print()
+        lines = [
+            Fore.YELLOW + Style.BRIGHT + "═" * 60,
+            Fore.YELLOW + Style.BRIGHT + "⏰ TIME'S UP! You didn't answer in time.",
+            Fore.YELLOW + Style.BRIGHT + "═" * 60,
+        ]
+    else:
+        lines = []
+    lines.append("")
+    return format_lines(lines)
+
+
+def render_leaderboard(scores_data):
+    """Return the leaderboard."""
+    lines = [
+        "",
+        separator("═", 60, Fore.CYAN),
+        Fore.CYAN + Style.BRIGHT + "🏆 LEADERBOARD",
+        separator("═", 60, Fore.CYAN),
+        "",
+    ]
     
     if scores_data == "EMPTY:0" or not scores_data:
-        print(Fore.YELLOW + "No scores yet.")
+        lines.append(Fore.YELLOW + "No scores yet.")
     else:
         # Parse scores: "user1:100|user2:50|user3:25"
         entries = scores_data.split("|")
@@ -185,16 +246,22 @@ def print_leaderboard(scores_data):
                 else:
                     medal = f"{rank}."
                 
-                print(f"{prefix}{color}{medal} {username}: {points} pts")
+                lines.append(f"{prefix}{color}{medal} {username}: {points} pts")
     
-    print()
-    print_separator("═", 60, Fore.CYAN)
+    lines.append("")
+    lines.append(separator("═", 60, Fore.CYAN))
+    return format_lines(lines)
 
 
 def send_message(message: str) -> bool:
     """Send a message to the server."""
+    return send_data(message.encode(ENCODING) + b"\n")
+
+
+def send_data(data: bytes) -> bool:
+    """Send already-encoded, newline-terminated bytes to the server."""
     try:
-        sock.sendall((message + "\n").encode(ENCODING))
+        sock.sendall(data)
         return True
     except OSError as e:
         print(Fore.RED + f"\n[ERROR] Failed to send message: {e}")
@@ -216,129 +283,159 @@ def receive_loop():
     - error:<message> - Error message
     """
     global running, current_question, current_question_id, question_timeout
-    global timer_value, answered, waiting_for_results, sock
+    global timer_value, answered, waiting_for_results, sock, last_timer_bar
+    
+    buffer = bytearray()  # Received bytes not yet split into lines
+    # Everything rendered for one read is written with a single write, so a
+    # burst like feedback + score + broadcast repaints the terminal once
+    out = []
     
-    buffer = ""
+    def flush_out():
+        if out:
+            write_text("".join(out))
+            out.clear()
+    
+    # recv_into() reuses this instead of allocating a bytes object per read
+    recv_buf = bytearray(RECV_SIZE)
+    recv_view = memoryview(recv_buf)
     
     while running:
         try:
-            chunk = sock.recv(4096)
-            if not chunk:
+            n = sock.recv_into(recv_buf)
+            if not n:
                 print(Fore.RED + "\n[ERROR] Connection closed by server.")
                 running = False
                 break
             
-            buffer += chunk.decode(ENCODING, errors="ignore")
+            buffer += recv_view[:n]
             
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
-                line = line.strip()
+            # Cut lines out with find() from a moving start index and drop
+            # the consumed prefix once per read; only whole lines are decoded
+            start = 0
+            while True:
+                nl = buffer.find(b"\n", start)
+                if nl < 0:
+                    break
+                line = str(buffer[start:nl], ENCODING, "ignore").strip()
+                start = nl + 1
                 
                 if not line:
                     continue
                 
-                # Parse different message types
-                if line.startswith("broadcast:"):
-                    msg = line.split(":", 1)[1]
-                    print(Fore.CYAN + Style.BRIGHT + f"\n📢 {msg}")
+                # Parse different message types. One scan splits
+                # "<kind>:<payload>"; the branches compare kind instead of
+                # re-testing the line with startswith()
+                kind, sep, payload = line.partition(":")
+                if not sep:
+                    continue
+                
+                if kind == "broadcast":
+                    msg = payload
+                    out.append(format_lines([Fore.CYAN + Style.BRIGHT + f"\n📢 {msg}"]))
                     
                     # Special handling for specific broadcasts
                     if "TIMEUP" in msg or "Winner=" in msg:
                         # Parse: "TIMEUP Correct=A Winner=user1 Points=950"
-                        parts = msg.split()
-                        correct = winner = points = None
-                        
-                        for part in parts:
-                            if part.startswith("Correct="):
-                                correct = part.split("=")[1]
-                            elif part.startswith("Winner="):
-                                winner = part.split("=")[1]
-                            elif part.startswith("Points="):
-                                points = part.split("=")[1]
-                        
-                        if correct:
-                            print_results(winner, correct, points)
+                        match = TIMEUP_RE.search(msg)
+                        if match:
+                            correct, winner, points = match.groups()
+                            out.append(render_results(winner, correct, points))
                     
                     elif "QUIZ_START" in msg:
+                        flush_out()
                         clear_screen()
-                        print_header()
-                        print(Fore.GREEN + Style.BRIGHT + "🚀 QUIZ IS STARTING!")
-                        print()
+                        out.append(render_header())
+                        out.append(format_lines([
+                            Fore.GREEN + Style.BRIGHT + "🚀 QUIZ IS STARTING!",
+                            "",
+                        ]))
                     
                     elif "QUIZ_END" in msg:
-                        print()
-                        print(Fore.CYAN + Style.BRIGHT + "🎉 QUIZ COMPLETED!")
-                        print()
+                        out.append(format_lines([
+                            "",
+                            Fore.CYAN + Style.BRIGHT + "🎉 QUIZ COMPLETED!",
+                            "",
+                        ]))
                 
-                elif line.startswith("question:"):
+                elif kind == "question":
                     # Format: "question:<id>:<timeout>:<text>"
-                    parts = line.split(":", 3)
-                    if len(parts) >= 4:
-                        question_id = parts[1]
-                        timeout = int(parts[2])
-                        question_text = parts[3]
+                    parts = payload.split(":", 2)
+                    if len(parts) >= 3:
+                        question_id = parts[0]
+                        timeout = int(parts[1])
+                        question_text = parts[2]
                         
                         current_question_id = question_id
                         current_question = question_text
                         question_timeout = timeout
                         answered = False
                         waiting_for_results = False
+                        question_ready.set()
+                        last_timer_bar = None  # The screen is cleared below
                         
                         # Clear screen and display question
+                        flush_out()
                         clear_screen()
-                        print_header()
-                        print_question_box(question_text, question_id, timeout)
-                        print(Fore.GREEN + "Type your answer (A, B, C, or D) and press Enter:")
-                        print()
+                        out.append(render_header())
+                        out.append(render_question_box(question_text, question_id, timeout))
+                        out.append(format_lines([
+                            Fore.GREEN + "Type your answer (A, B, C, or D) and press Enter:",
+                            "",
+                        ]))
                 
-                elif line.startswith("timer:"):
+                elif kind == "timer":
                     # Format: "timer:<seconds_remaining>"
-                    seconds = int(line.split(":", 1)[1])
+                    seconds = int(payload)
                     timer_value = seconds
                     
                     # Only show timer if we're in a question and haven't answered
                     if current_question and not answered and not waiting_for_results:
-                        print_timer(seconds)
+                        out.append(render_timer(seconds))
                 
-                elif line.startswith("show:results"):
+                elif kind == "show" and payload.startswith("results"):
                     waiting_for_results = True
-                    print("\n")
+                    question_ready.clear()
+                    out.append("\n\n")
                 
-                elif line.startswith("show:leaderboard"):
+                elif kind == "show" and payload.startswith("leaderboard"):
                     # Next message will be the leaderboard
                     pass
                 
-                elif line.startswith("feedback:"):
+                elif kind == "feedback":
                     # Format: "feedback:<username>:<result>:<points>:<time>"
-                    parts = line.split(":", 4)
-                    if len(parts) >= 5:
-                        username = parts[1]
-                        result = parts[2]
-                        points = parts[3]
-                        time_taken = parts[4]
+                    parts = payload.split(":", 3)
+                    if len(parts) >= 4:
+                        username = parts[0]
+                        result = parts[1]
+                        points = parts[2]
+                        time_taken = parts[3]
                         
                         if username == my_username:
-                            print_feedback(result, points, time_taken)
+                            out.append(render_feedback(result, points, time_taken))
                 
-                elif line.startswith("score:"):
+                elif kind == "score":
                     # Format: "score:<leaderboard_data>"
-                    scores_data = line.split(":", 1)[1]
-                    print_leaderboard(scores_data)
+                    out.append(render_leaderboard(payload))
                 
-                elif line.startswith("error:"):
-                    error_msg = line.split(":", 1)[1]
-                    print(Fore.RED + Style.BRIGHT + f"\n❌ ERROR: {error_msg}")
+                elif kind == "error":
+                    error_msg = payload
+                    out.append(format_lines([Fore.RED + Style.BRIGHT + f"\n❌ ERROR: {error_msg}"]))
                     
                     if "username_taken" in error_msg or "ip_exists" in error_msg:
-                        print(Fore.YELLOW + "Please restart and choose a different username.")
+                        out.append(format_lines([Fore.YELLOW + "Please restart and choose a different username."]))
                         running = False
+            
+            del buffer[:start]
+            flush_out()
         
         except OSError:
+            flush_out()
             if running:
                 print(Fore.RED + "\n[ERROR] Connection lost.")
             running = False
             break
         except Exception as e:
+            flush_out()
             print(Fore.RED + f"\n[ERROR] Unexpected error: {e}")
             running = False
             break
@@ -352,19 +449,22 @@ def input_loop():
     
     while running:
         try:
-            if current_question and not answered and not waiting_for_results:
-                user_input = input().strip().upper()
-                
-                if user_input in ("A", "B", "C", "D"):
-                    if send_message(f"answer:{user_input}"):
-                        answered = True
-                        print(Fore.GREEN + f"\n✅ Answer '{user_input}' submitted!")
-                        print(Fore.YELLOW + "⏳ Waiting for results...")
-                        print()
-                elif user_input:
-                    print(Fore.RED + "Invalid input! Please enter A, B, C, or D.")
-            else:
-                time.sleep(0.1)
+            # Wake as soon as a question opens rather than on a 100 ms poll;
+            # the timeout only bounds how late a shutdown is noticed
+            if not question_ready.wait(INPUT_WAIT_TIMEOUT):
+                continue
+            
+            user_input = input().strip().upper()
+            
+            if user_input in ANSWER_LINES:
+                if send_data(ANSWER_LINES[user_input]):
+                    answered = True
+                    question_ready.clear()
+                    print(Fore.GREEN + f"\n✅ Answer '{user_input}' submitted!")
+                    print(Fore.YELLOW + "⏳ Waiting for results...")
+                    print()
+            elif user_input:
+                print(Fore.RED + "Invalid input! Please enter A, B, C, or D.")
         
         except EOFError:
             break
@@ -388,6 +488,8 @@ def connect_to_server(host: str, port: int, username: str) -> bool:
         sock.settimeout(10)  # 10 second timeout for connection
         sock.connect((host, port))
         sock.settimeout(None)  # Remove timeout after connection
+        # Send answers immediately instead of waiting on Nagle
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         
         print(Fore.GREEN + "✅ Connected!")
         print()
@@ -423,7 +525,7 @@ def main():
     global running, sock
     
     clear_screen()
-    print_header()
+    write_text(render_header())
     
     # Get server address
     print(Fore.CYAN + "Enter server details:")
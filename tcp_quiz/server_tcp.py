@@ -20,13 +20,14 @@ Control flow (high level):
 1. main():
    - Load questions.
    - Start TCP listening socket.
-   - Start accept_loop() thread to handle new clients.
+   - Start io_loop() and accept_loop() threads to handle new clients.
    - Run game_loop() to control quiz start and question sequence.
 
 2. accept_loop():
-   - For each new TCP connection, start handle_client() in a thread.
+   - Register each new TCP connection with the selector.
 
-3. handle_client():
+3. io_loop() / handle_client():
+   - One thread waits on the selector and handles readable sockets.
    - Read initial "join:<username>" message.
    - Register the player, then listen for "answer:<X>" messages.
    - Store last_answer and answer_time for that player.
@@ -45,27 +46,61 @@ Control flow (high level):
    - Broadcast TIMEUP + winner + points earned + updated leaderboard.
 """
 
+import bisect
 import os
+import queue
+import selectors
 import socket
+import sys
 import threading
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 HOST = "0.0.0.0"          # Listen on all interfaces
 PORT = 8888
 QUESTION_TIMEOUT = 15      # Default seconds for each question
+# Listening sockets sharing PORT via SO_REUSEPORT (Linux/BSD). Keep at 1
+# unless accept() is a real bottleneck: with SO_REUSEPORT a second server
+# started on the same port by mistake binds without error, and the kernel
+# silently splits new players between the two games.
+LISTENERS = 1
 ENCODING = "utf-8"
 
+# Pre-encoded prefixes of the recurring protocol messages
+B_QUESTION = b"question:"
+B_BROADCAST = b"broadcast:"
+B_TIMER = b"timer:"
+B_NL = b"\n"
+
 # ====== QUIZ QUESTIONS (loaded from file) ======
 QUESTIONS: List[Dict] = []
 
 # ====== SERVER STATE ======
 clients_lock = threading.Lock()
-players: List[Dict] = []       # All connected players
+sel = selectors.DefaultSelector()  # Client sockets serviced by io_loop()
+answer_cond = threading.Condition(clients_lock)  # Signaled on answer/disconnect
+# Players are stored as parallel arrays (one slot per connection, never
+# removed) so hot scans walk flat lists instead of one dict per player.
+usernames: List[str] = []                   # slot -> username
+socks: List[socket.socket] = []             # slot -> client socket
+ips: List[str] = []                         # slot -> client IP
+alive = bytearray()                         # slot -> 1 if connected
+last_answers: List[Optional[str]] = []      # slot -> answer this question
+answer_times: List[Optional[float]] = []    # slot -> when it was answered
+idx_by_name: Dict[str, int] = {}            # username -> latest slot
 scores: Dict[str, int] = {}    # username -> points
+# (-points, join order, username), kept sorted so it is already the
+# leaderboard order; only changed through add_points()
+score_order: List[Tuple[int, int, str]] = []
+score_seq: Dict[str, int] = {}  # username -> join order (breaks ties)
 streaks: Dict[str, int] = {}   # username -> current streak count
 server_running = True
 skip_to_next = False           # Host can skip to next question
+# Console lines from the answer path, written out by log_worker()
+log_q: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+# Reused by io_loop() for every recv_into(); only that thread touches it
+recv_buf = bytearray(4096)
+recv_view = memoryview(recv_buf)
 
 
 # ---------- Kahoot-Style Scoring Functions ----------
@@ -140,6 +175,8 @@ def listen_for_host_commands():
                     if char == b'\r':  # Enter key
                         if input_buffer.strip().lower() == "skip":
                             skip_to_next = True
+                            with answer_cond:
+                                answer_cond.notify_all()  # Wake ask_question()
                             print("\n[HOST] ⏭️  Skipping to next question...")
                         input_buffer = ""  # Reset buffer
                     elif char == b'\x08':  # Backspace
@@ -211,15 +248,16 @@ def load_questions_from_file() -> None:
             if not line or line.startswith("#"):
                 continue
 
-            parts = line.split("|")
-            if len(parts) != 2:
+            text, sep, correct = line.partition("|")
+            if not sep:
                 print(f"[SERVER] Skipping invalid question line: {line}")
                 continue
 
-            text = parts[0].strip()
-            correct = parts[1].strip().upper()
+            text = text.strip()
+            correct = correct.strip().upper()
 
-            if correct not in {"A", "B", "C", "D"}:
+            # A second "|" leaves it in correct, so this also rejects it
+            if correct not in ("A", "B", "C", "D"):
                 print(
                     "[SERVER] Skipping, invalid correct option "
                     f"'{correct}' in: {line}"
@@ -238,72 +276,126 @@ def load_questions_from_file() -> None:
     print(f"[SERVER] Loaded {len(QUESTIONS)} questions from {qpath}")
 
 
+def encode_questions(question_timeout: int) -> None:
+    """
+    Pre-encode the "question:<id>:<timeout>:<text>" line of every question.
+
+    The line embeds the timeout, which the host only chooses after the file
+    is loaded, so this runs once the timeout is known. ask_question() then
+    sends question["encoded"] as-is instead of rebuilding it.
+    """
+    for q in QUESTIONS:
+        q["encoded"] = encode_msg(
+            B_QUESTION, f"{q['id']}:{question_timeout}:{q['text']}"
+        )
+
+
 # ---------- Utility functions ----------
 
 
-def safe_send(sock: socket.socket, message: str) -> None:
+def log_worker() -> None:
+    """
+    Write queued console lines to stdout (runs in a daemon thread).
+
+    The answer path only formats its line and puts it on log_q, so it never
+    waits on the stdout lock or a write() while it holds clients_lock.
+    """
+    while True:
+        sys.stdout.write(log_q.get() + "\n")
+        sys.stdout.flush()
+
+
+def safe_send(sock: socket.socket, message: str) -> bool:
     """
     Send one line to a client safely.
 
     The message is terminated by a newline, so clients can use line-based
-    parsing. Any socket error is silently ignored (client may be gone).
+    parsing. Socket errors are not raised (client may be gone); instead
+    False is returned so the caller can mark that player as not alive.
     """
     try:
         sock.sendall((message + "\n").encode(ENCODING))
+        return True
     except OSError:
-        pass
+        return False
+
+
+def mark_dead(idx: int) -> None:
+    """
+    Mark a player whose socket failed as not alive and wake ask_question().
+
+    Must be called with clients_lock held. Dead peers are otherwise detected
+    by handle_client() when recv() returns 0 or raises.
+    """
+    alive[idx] = 0
+    answer_cond.notify_all()
+
+
+def encode_msg(prefix: bytes, body: str) -> bytes:
+    """Build one newline-terminated message from a pre-encoded prefix."""
+    return prefix + body.encode(ENCODING) + B_NL
 
 
 def broadcast(message: str) -> None:
     """
     Send a line to all currently connected (alive) clients.
 
-    Uses clients_lock to iterate over players safely.
+    The line is encoded once up front rather than once per player.
     """
-    with clients_lock:
-        for player in players:
-            if player["alive"]:
-                safe_send(player["sock"], message)
+    broadcast_data((message + "\n").encode(ENCODING))
 
 
-def remove_dead_clients() -> None:
+def broadcast_data(data: bytes) -> None:
     """
-    Mark disconnected clients as not alive.
+    Send already-encoded, newline-terminated bytes to all alive clients.
 
-    Technique:
-    - Try to send empty bytes b"" to each alive client's socket.
-    - If an OSError is raised, mark that client as not alive.
+    Uses clients_lock to iterate over players safely.
     """
     with clients_lock:
-        for player in players:
-            if not player["alive"]:
+        for idx, sock in enumerate(socks):
+            if not alive[idx]:
                 continue
             try:
-                # Sending empty bytes just to check if socket is still OK
-                player["sock"].sendall(b"")
+                sock.sendall(data)
             except OSError:
-                player["alive"] = False
+                mark_dead(idx)
+
+
+def broadcast_many(messages: List[str]) -> None:
+    """
+    Send several lines to all alive clients with one sendall() per client.
+
+    The lines are joined with newlines before sending, so clients still
+    parse them as separate messages.
+    """
+    broadcast("\n".join(messages))
 
 
 def any_alive_players() -> bool:
     """Return True if at least one player is currently alive/connected."""
     with clients_lock:
-        return any(player["alive"] for player in players)
+        return 1 in alive
 
 
 def alive_player_count() -> int:
     """Return the number of currently alive/connected players."""
     with clients_lock:
-        return sum(1 for player in players if player["alive"])
+        return alive.count(1)
 
 
-def all_players_answered() -> bool:
-    """Check if all alive players have submitted an answer."""
-    with clients_lock:
-        for player in players:
-            if player["alive"] and player["last_answer"] is None:
-                return False
-        return True
+def add_points(username: str, points: int) -> None:
+    """
+    Add points to a player's score and move them to their new rank.
+
+    Keeps score_order sorted with bisect instead of re-sorting all scores
+    every time the leaderboard is sent. Adding 0 registers a new player.
+    """
+    seq = score_seq.setdefault(username, len(score_seq))
+    old = scores.get(username)
+    if old is not None:
+        score_order.pop(bisect.bisect_left(score_order, (-old, seq, username)))
+    scores[username] = (old or 0) + points
+    bisect.insort(score_order, (-scores[username], seq, username))
 
 
 def leaderboard_text() -> str:
@@ -314,44 +406,25 @@ def leaderboard_text() -> str:
         "score:EMPTY:0"          if there are no scores yet
         "score:user1:3|user2:2"  otherwise (sorted by points desc)
     """
-    if not scores:
+    if not score_order:
         return "score:EMPTY:0"
 
-    ordered = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-    parts = [f"{uname}:{pts}" for uname, pts in ordered]
+    parts = [f"{uname}:{-neg_pts}" for neg_pts, _, uname in score_order]
     return "score:" + "|".join(parts)
 
 
-# ---------- Per-client handler ----------
+# ---------- Per-client handlers (driven by io_loop) ----------
 
 
-def handle_client(conn: socket.socket, addr: Tuple[str, int]) -> None:
+def register_player(conn: socket.socket, client: Dict, first_line: str) -> bool:
     """
-    Handle communication with one TCP client.
+    Handle the first line from a client, which should be "join:<username>".
 
-    Steps:
-    1. Read the very first message, which should be "join:<username>".
-    2. Validate that the username is not already in use.
-    3. Register the player and broadcast that they joined.
-    4. In a loop, read lines and look for "answer:<A/B/C/D>" messages.
-       - Store the latest answer in player["last_answer"].
-    5. When connection ends, mark player as not alive.
+    Validates that the username and IP are not already in use, then
+    registers the player and broadcasts that they joined. Returns False if
+    the client was rejected (its socket is closed).
     """
-    print(f"[SERVER] New connection from {addr}")
-
-    try:
-        raw_bytes = conn.recv(4096)
-    except OSError:
-        conn.close()
-        return
-
-    if not raw_bytes:
-        conn.close()
-        return
-
-    raw = raw_bytes.decode(ENCODING, errors="ignore")
-
-    first_line = raw.strip().splitlines()[0] if raw.strip() else ""
+    addr = client["addr"]
     if first_line.startswith("join:"):
         username = first_line.split(":", 1)[1].strip()
     else:
@@ -359,75 +432,145 @@ def handle_client(conn: socket.socket, addr: Tuple[str, int]) -> None:
 
     with clients_lock:
         client_ip = addr[0]
+        error = None
 
         # 1) Reject duplicate username
-        for p in players:
-            if p["alive"] and p["username"] == username:
-                safe_send(conn, "error:username_taken")
-                print(
-                    "[SERVER] Username "
-                    f"'{username}' already taken, rejecting {addr}"
-                )
-                conn.close()
-                return
+        taken = idx_by_name.get(username)
+        if taken is not None and alive[taken]:
+            error = "error:username_taken"
+            print(
+                "[SERVER] Username "
+                f"'{username}' already taken, rejecting {addr}"
+            )
 
         # 2) Reject second connection from the same IP (same machine)
-        for p in players:
-            if p["alive"] and p.get("ip") == client_ip:
-                safe_send(conn, "error:ip_exists")
-                print(
-                    f"[SERVER] IP {client_ip} already connected, "
-                    f"rejecting {username} {addr}"
-                )
-                conn.close()
-                return        # 3) Register the new player
-        player = {
-            "sock": conn,
-            "username": username,
-            "alive": True,
-            "last_answer": None,
-            "answer_time": None,  # Track when they answered
-            "ip": client_ip,
-        }
-        players.append(player)
-        scores.setdefault(username, 0)
-        streaks.setdefault(username, 0)  # Initialize streak tracking
+        elif any(alive[i] and ip == client_ip for i, ip in enumerate(ips)):
+            error = "error:ip_exists"
+            print(
+                f"[SERVER] IP {client_ip} already connected, "
+                f"rejecting {username} {addr}"
+            )
+
+        else:
+            # 3) Register the new player in a fresh slot
+            idx = len(usernames)
+            usernames.append(username)
+            socks.append(conn)
+            ips.append(client_ip)
+            alive.append(1)
+            last_answers.append(None)
+            answer_times.append(None)  # Track when they answered
+            idx_by_name[username] = idx
+            if username not in scores:
+                add_points(username, 0)
+            streaks.setdefault(username, 0)  # Initialize streak tracking
+            client["idx"] = idx
+
+    if error:
+        safe_send(conn, error)
+        close_client(conn, client)
+        return False
 
     print(f"[SERVER] {username} joined.")
-    broadcast(f"broadcast:{username} joined the game")
+    broadcast_data(encode_msg(B_BROADCAST, f"{username} joined the game"))
+    return True
 
-    # There might be extra data after the first line in the initial buffer
-    buffer = "\n".join(raw.splitlines()[1:])
 
-    # Listen for messages from this client as long as server is running
-    while server_running:
-        if not buffer:
-            try:
-                chunk = conn.recv(4096)
-            except OSError:
-                break
+def close_client(conn: socket.socket, client: Dict) -> None:
+    """Stop watching a client socket, close it and mark its player as gone."""
+    try:
+        sel.unregister(conn)
+    except (KeyError, ValueError):
+        pass
+    conn.close()
 
-            if not chunk:
-                break
+    idx = client["idx"]
+    if idx is not None:
+        print(f"[SERVER] {usernames[idx]} disconnected.")
+        with answer_cond:
+            alive[idx] = 0
+            answer_cond.notify_all()
 
-            buffer += chunk.decode(ENCODING, errors="ignore")
-
-        while "\n" in buffer:
-            line, buffer = buffer.split("\n", 1)
-            line = line.strip()
-            if not line:
-                continue            # Message format: "answer:<A/B/C/D>"
-            if line.startswith("answer:"):
-                ans = line.split(":", 1)[1].strip().upper()
-                with clients_lock:
-                    player["last_answer"] = ans
-                    player["answer_time"] = time.time()  # Record answer timestamp
-                print(f"[SERVER] {username} answered {ans}")
-
-    print(f"[SERVER] {username} disconnected.")
-    with clients_lock:
-        player["alive"] = False
-    conn.close()
+
+def handle_client(conn: socket.socket, client: Dict) -> None:
+    """
+    Handle one readable event on a client socket.
+
+    Called by io_loop() whenever conn has data, so recv_into() never
+    blocks. Data lands in the shared recv_buf rather than a new bytes object.
+    Steps:
+    1. The very first chunk carries "join:<username>" (see register_player).
+    2. After that, complete lines are cut out of the client["buffer"]
+       bytearray with find(b"\\n") and checked for "answer:<A/B/C/D>";
+       only the answer letter is decoded.
+       - Store the latest answer in last_answers[idx].
+    3. When the connection ends, the player is marked as not alive.
+    """
+    try:
+        n = conn.recv_into(recv_buf)
+    except OSError:
+        n = 0
+
+    if not n:
+        close_client(conn, client)
+        return
+
+    buf = client["buffer"]
+    buf += recv_view[:n]
+
+    if client["idx"] is None:
+        # There might be extra data after the first line in the initial buffer
+        raw = buf.strip()
+        nl = raw.find(b"\n")
+        first_line = raw if nl < 0 else raw[:nl]
+        buf[:] = b"" if nl < 0 else raw[nl + 1:]
+        if not register_player(conn, client, first_line.decode(ENCODING, errors="ignore")):
+            return
+
+    idx = client["idx"]
+    while True:
+        nl = buf.find(b"\n")
+        if nl < 0:
+            break
+        line = bytes(buf[:nl]).strip()
+        del buf[:nl + 1]
+        if not line:
+            continue
+
+        # Message format: "answer:<A/B/C/D>"
+        if line.startswith(b"answer:"):
+            ans = line[7:].strip().upper().decode(ENCODING, errors="ignore")
+            # Stamp the answer before taking the lock so waiting on it never
+            # counts against the player's speed bonus. The lock only covers
+            # the two slot stores and the wake-up of ask_question().
+            answered_at = time.time()
+            with answer_cond:
+                last_answers[idx] = ans
+                answer_times[idx] = answered_at
+                answer_cond.notify_all()
+            log_q.put(f"[SERVER] {usernames[idx]} answered {ans}")
+
+
+def io_loop() -> None:
+    """
+    Single thread that services every client socket.
+
+    Waits on the selector (epoll on Linux) and calls handle_client() for
+    each readable socket, so there is no per-connection thread.
+    """
+    while server_running:
+        if not sel.get_map():
+            # Nothing registered yet (select() on Windows rejects empty sets)
+            time.sleep(0.1)
+            continue
+
+        for key, _ in sel.select(timeout=0.1):
+            # One bad connection must not kill the thread serving everyone
+            try:
+                handle_client(key.fileobj, key.data)
+            except Exception as e:
+                print(f"[SERVER] ❌ Error handling client {key.data['addr']}: {e}")
+                close_client(key.fileobj, key.data)
 
 
 # ---------- Quiz logic ----------
@@ -439,11 +582,10 @@ def ask_question(question: Dict, question_timeout: int) -> None:
 
     Enhanced Logic:
     - If no players are alive, skip the question.
-    - Broadcast "question:<id>:<text>" to all clients.
+    - Broadcast the pre-encoded "question:<id>:<timeout>:<text>" line.
     - Record question start time.
     - Reset each player's last_answer and answer_time.
-    - Until timeout:
-        * Check for disconnected players.
+    - Until timeout (sleeping on answer_cond between answers):
         * Track all players who answer correctly with their timestamps.
         * Calculate time-based bonus points (500-1000) for each correct answer.
         * First correct answer is the "winner" (gets special recognition).
@@ -462,7 +604,7 @@ def ask_question(question: Dict, question_timeout: int) -> None:
     correct = question["correct_option"].strip().upper()
 
     # Broadcast question to all clients
-    broadcast(f"question:{qid}:{question_timeout}:{text}")
+    broadcast_data(question["encoded"])
     print(f"\n[SERVER] Question {qid}: {text}")
 
     # Record start time and reset player states for this question
@@ -474,9 +616,9 @@ def ask_question(question: Dict, question_timeout: int) -> None:
 
     # Reset last_answer and answer_time for all players
     with clients_lock:
-        for p in players:
-            p["last_answer"] = None
-            p["answer_time"] = None
+        for i in range(len(last_answers)):
+            last_answers[i] = None
+            answer_times[i] = None
 
     # Track results for this question
     winner = None
@@ -485,15 +627,17 @@ def ask_question(question: Dict, question_timeout: int) -> None:
     wrong_answers = []    # List of usernames who answered incorrectly
     
     deadline = time.time() + question_timeout
-    last_broadcast_time = -1  # Track last timer broadcast    # Monitor answers until timeout OR all players answer OR host skip
+    last_broadcast_time = -1  # Track last timer broadcast
+
+    # Monitor answers until timeout OR all players answer OR host skip.
+    # Instead of polling, sleep on answer_cond: handle_client() wakes us when
+    # an answer arrives or a player drops, otherwise we wake for the next
+    # timer tick.
     while time.time() < deadline:
-        time.sleep(0.05)
-        remove_dead_clients()
-        
         # Broadcast remaining time every second
         remaining = int(deadline - time.time())
         if remaining >= 0 and remaining != last_broadcast_time:
-            broadcast(f"timer:{remaining}")
+            broadcast_data(encode_msg(B_TIMER, str(remaining)))
             last_broadcast_time = remaining
         
         # Check if server is shutting down (Ctrl+C)
@@ -506,20 +650,14 @@ def ask_question(question: Dict, question_timeout: int) -> None:
             print("[SERVER] Host skipped to next question!")
             break
 
-        # If everyone disconnected in the middle of the question, stop
-        if not any_alive_players():
-            print("[SERVER] All players disconnected during question.")
-            break
-
-        # Check all players' answers FIRST (before checking if all answered)
-        with clients_lock:
-            for p in players:
-                if not p["alive"]:
+        with answer_cond:
+            # Check all players' answers FIRST (before checking if all answered)
+            for i, ans in enumerate(last_answers):
+                if not alive[i]:
                     continue
                 
-                ans = p["last_answer"]
-                ans_time = p["answer_time"]
-                username = p["username"]
+                ans_time = answer_times[i]
+                username = usernames[i]
                 
                 # Skip if player hasn't answered yet
                 if ans is None or ans_time is None:
@@ -542,24 +680,42 @@ def ask_question(question: Dict, question_timeout: int) -> None:
                         winner = username
                         winner_points = points
                         streaks[username] = streaks.get(username, 0) + 1
-                        print(f"[SERVER] 🏆 {winner} answered first! +{points} pts (in {time_taken:.2f}s)")
+                        log_q.put(f"[SERVER] 🏆 {winner} answered first! +{points} pts (in {time_taken:.2f}s)")
                     else:
                         streaks[username] = streaks.get(username, 0) + 1
-                        print(f"[SERVER] ✅ {username} also correct! +{points} pts (in {time_taken:.2f}s)")
+                        log_q.put(f"[SERVER] ✅ {username} also correct! +{points} pts (in {time_taken:.2f}s)")
                     
                     # Update score
-                    scores[username] = scores.get(username, 0) + points
+                    add_points(username, points)
                 else:
                     # WRONG ANSWER
                     wrong_answers.append(username)
                     streaks[username] = 0  # Reset streak
-                    print(f"[SERVER] ❌ {username} answered {ans} (incorrect)")
+                    log_q.put(f"[SERVER] ❌ {username} answered {ans} (incorrect)")
+
+            # AFTER processing answers, check who is left and who answered
+            everyone_left = 1 not in alive
+            everyone_answered = all(
+                ans is not None
+                for i, ans in enumerate(last_answers)
+                if alive[i]
+            )
 
-        # AFTER processing answers, check if all alive players have answered
-        if all_players_answered():
-            print("[SERVER] ✅ All players answered! Auto-advancing...")
+            if not (everyone_left or everyone_answered):
+                # Sleep until an answer/disconnect or the next timer tick
+                answer_cond.wait(timeout=max(0.0, deadline - remaining - time.time()))
+
+        # If everyone disconnected in the middle of the question, stop
+        if everyone_left:
+            print("[SERVER] All players disconnected during question.")
+            break
+
+        if everyone_answered:
+            log_q.put("[SERVER] ✅ All players answered! Auto-advancing...")
             time.sleep(0.5)  # Brief pause before results
-            break    # === BROADCAST RESULTS ===
+            break
+
+    # === BROADCAST RESULTS ===
     
     print(f"\n[SERVER] Time's up! Results:")
     
@@ -569,21 +725,19 @@ def ask_question(question: Dict, question_timeout: int) -> None:
     
     # 1. Announce winner (or no winner)
     if winner:
-        winner_msg = f"broadcast:TIMEUP Correct={correct} Winner={winner} Points={winner_points}"
-        broadcast(winner_msg)
+        winner_msg = f"TIMEUP Correct={correct} Winner={winner} Points={winner_points}"
+        broadcast_data(encode_msg(B_BROADCAST, winner_msg))
         print(f"[SERVER] Winner: {winner} with {winner_points} points!")
     else:
-        no_winner_msg = f"broadcast:TIMEUP Correct={correct} Winner=None"
-        broadcast(no_winner_msg)
+        no_winner_msg = f"TIMEUP Correct={correct} Winner=None"
+        broadcast_data(encode_msg(B_BROADCAST, no_winner_msg))
         print(f"[SERVER] No correct answers")
 
     # 2. Send individual feedback to all players
     with clients_lock:
-        for p in players:
-            if not p["alive"]:
+        for i, username in enumerate(usernames):
+            if not alive[i]:
                 continue
-                
-            username = p["username"]
             
             # Check if they got it correct
             if username in [u for u, _, _ in correct_answers]:
@@ -591,34 +745,29 @@ def ask_question(question: Dict, question_timeout: int) -> None:
                 for u, pts, t in correct_answers:
                     if u == username:
                         feedback = f"feedback:{username}:correct:{pts}:{t:.1f}"
-                        safe_send(p["sock"], feedback)
                         break
             elif username in wrong_answers:
                 feedback = f"feedback:{username}:wrong:0:0"
-                safe_send(p["sock"], feedback)
             else:
                 # Unanswered
                 feedback = f"feedback:{username}:timeout:0:0"
-                safe_send(p["sock"], feedback)
+
+            if not safe_send(socks[i], feedback):
+                mark_dead(i)
     
     # 3. Handle unanswered players (treat as incorrect - reset streak)
     unanswered = []
     with clients_lock:
-        for p in players:
-            if p["alive"]:
-                uname = p["username"]
+        for i, uname in enumerate(usernames):
+            if alive[i]:
                 if uname not in [u for u, _, _ in correct_answers] and uname not in wrong_answers:
                     unanswered.append(uname)
                     streaks[uname] = 0  # Reset streak for not answering    # Wait for players to see results
     time.sleep(3)
     
-    # 4. Show leaderboard page
-    broadcast("show:leaderboard")
-    time.sleep(0.3)
-    
-    # 5. Broadcast updated leaderboard
+    # 4. Show leaderboard page together with the updated leaderboard
     lb = leaderboard_text()
-    broadcast(lb)
+    broadcast_many(["show:leaderboard", lb])
     
     # Wait for players to see leaderboard
     time.sleep(3)
@@ -663,9 +812,9 @@ def game_loop() -> None:
     print(f"[SERVER] ✅ {player_count} player(s) connected!")
     print("[SERVER] ───────────────────────────────────────────")
     with clients_lock:
-        for p in players:
-            if p["alive"]:
-                print(f"[SERVER]   👤 {p['username']}")
+        for i, uname in enumerate(usernames):
+            if alive[i]:
+                print(f"[SERVER]   👤 {uname}")
     print("[SERVER] ───────────────────────────────────────────")
     print(f"[SERVER] 📝 {len(QUESTIONS)} questions loaded")
     print(f"[SERVER] 🏆 500-1000 points per correct answer (speed bonus!)")
@@ -738,6 +887,7 @@ def game_loop() -> None:
 
     # Limit quiz to first 10 questions
     questions_to_ask = QUESTIONS[:10]
+    encode_questions(question_timeout_seconds)
     
     # Run through questions (limited to 10)
     for i, q in enumerate(questions_to_ask, 1):
@@ -809,8 +959,8 @@ def display_final_results() -> None:
         print("[SERVER]   No scores recorded.")
         return
     
-    # Sort by score descending
-    ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    # Already sorted by score descending
+    ranked = [(uname, -neg_pts) for neg_pts, _, uname in score_order]
     
     # Display top 3 with podium
     for rank, (username, points) in enumerate(ranked[:3], 1):
@@ -850,8 +1000,8 @@ def main() -> None:
     Entry point for the Kahoot-style TCP quiz server.
 
     - Loads questions from file.
-    - Creates a listening TCP socket.
-    - Starts accept_loop() in a background thread to handle new clients.
+    - Creates the listening TCP socket(s).
+    - Starts io_loop() plus one accept_loop() thread per socket.
     - Runs game_loop() to manage the quiz lifecycle.    - On KeyboardInterrupt or stop, shuts down the server gracefully.
     """
     global server_running
@@ -878,10 +1028,20 @@ def main() -> None:
 
     load_questions_from_file()
 
-    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    srv.bind((HOST, PORT))
-    srv.listen(10)
+    # With LISTENERS > 1 and SO_REUSEPORT the kernel load-balances incoming
+    # connections across several listening sockets, each drained by its own
+    # accept thread. By default (or without SO_REUSEPORT) there is a single
+    # plain socket, so bind() fails with EADDRINUSE if the port is taken.
+    listener_count = LISTENERS if hasattr(socket, "SO_REUSEPORT") else 1
+    listeners: List[socket.socket] = []
+    for _ in range(listener_count):
+        srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if listener_count > 1:
+            srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        srv.bind((HOST, PORT))
+        srv.listen(10)
+        listeners.append(srv)
 
     print(f"[SERVER] 🌐 Server listening on {HOST}:{PORT}")
     print(f"[SERVER] ⏱️  Question timeout: {QUESTION_TIMEOUT} seconds")
@@ -892,12 +1052,12 @@ def main() -> None:
     print("[SERVER] (Press Ctrl+C to stop the server)")
     print()
 
-    def accept_loop() -> None:
+    def accept_loop(srv: socket.socket) -> None:
         """
-        Accept new client connections and spawn a handler thread for each.
+        Accept new client connections and hand each one to io_loop().
 
-        This runs in a daemon thread and stops when server_running is False
-        or the listening socket is closed.
+        One of these runs in a daemon thread per listening socket and stops
+        when server_running is False or its socket is closed.
         """
         while server_running:
             try:
@@ -905,13 +1065,19 @@ def main() -> None:
             except OSError:
                 break
 
-            threading.Thread(
-                target=handle_client,
-                args=(conn, addr),
-                daemon=True,
-            ).start()
+            # Messages are tiny and answer timing matters, so skip Nagle
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            print(f"[SERVER] New connection from {addr}")
+            sel.register(
+                conn,
+                selectors.EVENT_READ,
+                data={"addr": addr, "buffer": bytearray(), "idx": None},
+            )
 
-    threading.Thread(target=accept_loop, daemon=True).start()
+    threading.Thread(target=log_worker, daemon=True).start()
+    threading.Thread(target=io_loop, daemon=True).start()
+    for srv in listeners:
+        threading.Thread(target=accept_loop, args=(srv,), daemon=True).start()
 
     threading.Thread(target=listen_for_host_commands, daemon=True).start()
 
@@ -921,7 +1087,8 @@ def main() -> None:
         print("\n[SERVER] ⚠️  Shutting down...")
 
     server_running = False
-    srv.close()
+    for srv in listeners:
+        srv.close()
     print()
     print("[SERVER] ═══════════════════════════════════════════")
     print("[SERVER] 👋 Server stopped. Thanks for playing!")
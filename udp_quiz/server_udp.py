@@ -176,12 +176,16 @@ def load_questions_from_file():
             line = raw_line.strip()
             if not line or line.startswith("#"):
                 continue
-            parts = line.split("|")
-            if len(parts) != 2:
+            text, sep, correct = line.partition("|")
+            if not sep:
+                print(f"[SERVER] Skipping invalid question line: {line}")
+                continue
+            text = text.strip()
+            correct = correct.strip().upper()
+            # A second "|" leaves it in correct, so this also rejects it
+            if correct not in ("A", "B", "C", "D"):
                 print(f"[SERVER] Skipping invalid question line: {line}")
                 continue
-            text = parts[0].strip()
-            correct = parts[1].strip().upper()
             questions.append({
                 "id": qid,
                 "text": text,